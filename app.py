@@ -1,20 +1,89 @@
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
 import numpy as np
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from pathlib import Path
 import os
+import atexit
 import tempfile
 import shutil
 import zipfile
-import io
-from scipy.fft import fft, fftfreq
-import base64
+import hashlib
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from scipy.fft import rfft, rfftfreq, next_fast_len
 from signal_processor import SignalProcessor
-from report_generator import ReportGenerator
 from format_readers import get_reader_for_file
+from fast_kernels import abs_argmax, magnitude_and_peaks, summary_stats
+from downsampling import lttb
+from record_store import LazyRecord, prune_store, store_record
+
+# Verificar si pyFFTW está disponible (FFT multihilo con planes reutilizables)
+try:
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft as fftw_fft
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+    PYFFTW_AVAILABLE = True
+except ImportError:
+    PYFFTW_AVAILABLE = False
+
+# Verificar si CuPy está disponible con una GPU CUDA (FFT de registros largos)
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except ImportError:
+    CUPY_AVAILABLE = False
+except Exception:
+    # CuPy instalado pero sin GPU o sin driver CUDA utilizable
+    CUPY_AVAILABLE = False
+
+# Número máximo de puntos por traza al graficar en resolución reducida
+PLOT_MAX_POINTS = 2000
+
+# Extensiones de archivos de datos soportadas (los .ss se emparejan con su .ms)
+DATA_EXTENSIONS = {".ms", ".sac", ".mseed", ".miniseed", ".sgy", ".segy", ".txt", ".csv", ".dat", ".asc"}
+
+# Número de figuras de Plotly que se conservan por sesión para reutilizarlas
+FIGURE_CACHE_SIZE = 12
+
+# Tamaño del bloque para copiar archivos subidos a disco (4 MB)
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Tamaño mínimo (muestras en total) para calcular la FFT en GPU: por debajo,
+# la copia entre memoria del sistema y de la GPU cuesta más que la transformada
+GPU_FFT_MIN_SAMPLES = 1_000_000
+
+# Número de registros procesados que se conservan en disco (uno por entrada
+# de la caché de _load_and_process)
+RECORD_STORE_SIZE = 32
+
+# Número de reportes generados que se conservan en disco para volver a
+# descargarlos sin generarlos de nuevo
+REPORT_CACHE_SIZE = 8
+
+# Módulos cuyo código interviene en el contenido de un reporte
+REPORT_SOURCES = ('app.py', 'report_generator.py', 'signal_processor.py', 'fast_kernels.py')
+
+# Periodos del espectro de respuesta del reporte: de 0.1 a 10 segundos
+RESPONSE_SPECTRUM_PERIODS = np.logspace(-1, 1, 100)
+RESPONSE_SPECTRUM_PERIODS.flags.writeable = False
+
+# Colores personalizados para cada componente
+COLORS = {
+    "N": "#1f77b4",    # Azul
+    "E": "#2ca02c",   # Verde
+    "Z": "#d62728",     # Rojo
+    "vector_suma": "#9467bd"       # Morado
+}
+DEFAULT_COLOR = "#1f77b4"
 
 # Función para obtener unidades según el tipo de dato
+@functools.lru_cache(maxsize=None)
 def get_units_for_data_type(data_type):
     """
     Devuelve las unidades correspondientes al tipo de dato
@@ -44,15 +113,16 @@ st.set_page_config(
     }
 )
 
-# Estilos personalizados
-st.markdown("""
+# Estilos personalizados: el script de tema y la hoja de estilos se definen
+# como constantes del módulo y se envían juntos en un único bloque HTML
+THEME_JS = """
     <script>
         const prefersDark = window.matchMedia && window.matchMedia('(prefers-color-scheme: dark)').matches;
         localStorage.setItem('theme', prefersDark ? 'dark' : 'light');
     </script>
-""", unsafe_allow_html=True)
+"""
 
-st.markdown("""
+THEME_CSS = """
     <style>
     :root {
         --background-color: white;
@@ -152,25 +222,1136 @@ st.markdown("""
         color: var(--text-color);
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+THEME_HTML = THEME_JS + THEME_CSS
+
+st.markdown(THEME_HTML, unsafe_allow_html=True)
 
 def get_ss_file(ms_file_path):
     """Obtiene el archivo .ss correspondiente al archivo .ms"""
     return str(ms_file_path).replace('.ms', '.ss')
 
-def load_metadata(ss_file_path):
-    """Lee los metadatos del archivo .ss"""
-    metadata = {}
-    try:
-        with open(ss_file_path, 'r') as f:
-            content = f.read()
-            for line in content.split('\n'):
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    metadata[key.strip('"')] = value.strip('"')
-    except Exception as e:
-        st.error(f"Error al leer el archivo .ss: {str(e)}")
-    return metadata
+def _file_fingerprint(file_path):
+    """
+    Calcula una huella del contenido de un archivo para usarla como clave de caché
+    
+    El hash del contenido se recalcula solo si cambian el tamaño o la fecha
+    de modificación del archivo (los archivos subidos se escriben una vez).
+    
+    Args:
+        file_path (str): Ruta al archivo
+        
+    Returns:
+        tuple: Tamaño en bytes y hash BLAKE2b del contenido
+    """
+    stat = os.stat(file_path)
+    return stat.st_size, _content_digest(str(file_path), stat.st_size, stat.st_mtime_ns)
+
+@functools.lru_cache(maxsize=256)
+def _content_digest(file_path, size, mtime_ns):
+    """
+    Calcula el hash BLAKE2b del contenido de un archivo, leyéndolo por bloques
+    
+    Args:
+        file_path (str): Ruta al archivo
+        size (int): Tamaño del archivo (parte de la clave de la caché)
+        mtime_ns (int): Fecha de modificación (parte de la clave de la caché)
+        
+    Returns:
+        str: Hash hexadecimal del contenido
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(COPY_BUFFER_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _find_data_files(paths):
+    """
+    Agrupa los archivos disponibles en registros de datos sísmicos
+    
+    Args:
+        paths (iterable): Rutas (Path) de los archivos encontrados
+        
+    Returns:
+        list: Tuplas (ruta de datos, ruta de metadatos .ss o None)
+    """
+    # Conjunto de todas las rutas recibidas: el emparejamiento .ms/.ss se
+    # resuelve por pertenencia, sin consultar el sistema de archivos
+    all_paths = set(paths)
+    
+    # Filtrar por extensión en una sola pasada
+    data_paths = sorted(p for p in all_paths if p.suffix.lower() in DATA_EXTENSIONS)
+    data_files = []
+    
+    # Para archivos .ms, buscar sus correspondientes .ss
+    for path in data_paths:
+        if path.suffix.lower() == ".ms":
+            ss_path = path.with_suffix(".ss")
+            if ss_path in all_paths:
+                data_files.append((str(path), str(ss_path)))
+    
+    # Para otros formatos, no necesitan archivo de metadatos separado
+    for path in data_paths:
+        if path.suffix.lower() != ".ms":
+            data_files.append((str(path), None))
+    
+    return data_files
+
+def _script_thread_pool(max_workers):
+    """
+    Crea un pool de hilos que comparten el contexto de ejecución de Streamlit
+    
+    Los hilos creados por el script no tienen ScriptRunContext: Streamlit
+    registra un aviso en cada llamada a una función con st.cache_data y lo que
+    esta muestre con st.* no llega a la interfaz. Cada hilo del pool recibe
+    el contexto de la ejecución actual al iniciarse.
+    
+    Args:
+        max_workers (int): Número máximo de hilos
+        
+    Returns:
+        ThreadPoolExecutor: Pool de hilos con el contexto de Streamlit
+    """
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx())
+    )
+
+@st.cache_resource
+def _get_signal_processor(sampling_rate):
+    """
+    Devuelve el procesador de señales para una frecuencia de muestreo
+    
+    La instancia se comparte entre componentes, registros y reruns; el
+    procesador no guarda estado entre llamadas, por lo que puede usarse
+    desde varios hilos a la vez.
+    
+    Args:
+        sampling_rate (float): Frecuencia de muestreo en Hz
+        
+    Returns:
+        SignalProcessor: Procesador de señales
+    """
+    return SignalProcessor(sampling_rate)
+
+def _plot_series(time, values, high_detail=False, window=None):
+    """
+    Prepara una serie para graficar, reduciéndola con LTTB salvo que se pida alta resolución
+    
+    Si se indica la ventana visible, esta recibe los PLOT_MAX_POINTS puntos
+    y el resto del registro se reduce a una vista general para el rangeslider,
+    de modo que al acercar el zoom se ve el detalle de la ventana.
+    
+    Args:
+        time (numpy.array): Vector de tiempo
+        values (numpy.array): Valores de la serie
+        high_detail (bool): Si es True se envían todas las muestras
+        window (tuple, opcional): Tiempos (inicial, final) visibles en el gráfico
+        
+    Returns:
+        tuple: Arrays (tiempo, valores) a graficar
+    """
+    if high_detail:
+        return time, values
+    if window is None:
+        return lttb(time, values, PLOT_MAX_POINTS)
+    
+    # Índices de la ventana, incluyendo una muestra a cada lado para cubrir los bordes
+    start = max(int(np.searchsorted(time, window[0], side='right')) - 1, 0)
+    end = min(int(np.searchsorted(time, window[1], side='left')) + 1, len(time))
+    
+    parts = [
+        lttb(time[:start], values[:start], PLOT_MAX_POINTS // 4),
+        lttb(time[start:end], values[start:end], PLOT_MAX_POINTS),
+        lttb(time[end:], values[end:], PLOT_MAX_POINTS // 4)
+    ]
+    return (
+        np.concatenate([part_time for part_time, _ in parts]),
+        np.concatenate([part_values for _, part_values in parts])
+    )
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _downsampled_series(_data, fingerprint, field, window):
+    """
+    Reduce una serie de un registro para graficarla (en caché entre reruns)
+    
+    El registro no se hashea: la clave es su huella de contenido junto con
+    el campo y la ventana visible.
+    
+    Args:
+        _data (Mapping): Datos del registro procesados
+        fingerprint (tuple): Huella del contenido del registro
+        field (str): Clave de la serie en el registro
+        window (tuple): Tiempos (inicial, final) visibles en el gráfico
+        
+    Returns:
+        tuple: Arrays (tiempo, valores) a graficar
+    """
+    return _plot_series(_data['time'], _data[field], window=window)
+
+def _series_for_plot(data, field, scale, high_detail, window):
+    """
+    Obtiene una serie de un registro lista para graficar
+    
+    La conversión de unidades se aplica después de reducir la serie: LTTB
+    elige los mismos puntos con cualquier escala positiva, de modo que solo
+    se escalan los puntos graficados y la caché sirve para ambas unidades.
+    
+    Args:
+        data (Mapping): Datos del registro procesados
+        field (str): Clave de la serie en el registro
+        scale (float): Factor de conversión de unidades
+        high_detail (bool): Si es True se envían todas las muestras
+        window (tuple): Tiempos (inicial, final) visibles en el gráfico
+        
+    Returns:
+        tuple: Arrays (tiempo, valores) a graficar, los valores en float32
+    """
+    if high_detail:
+        # La serie completa no se guarda en caché: ya está en el registro
+        x_plot, y_plot = data['time'], data[field]
+    else:
+        x_plot, y_plot = _downsampled_series(data, data['fingerprint'], field, window)
+    if scale != 1.0:
+        y_plot = y_plot * scale
+    
+    # Plotly envía los arrays NumPy al navegador en binario con su tipo: las
+    # amplitudes van en float32 (la mitad de carga); el tiempo sigue en
+    # float64, que en float32 perdería resolución en registros largos
+    return x_plot, y_plot.astype(np.float32, copy=False)
+
+def _cached_figure(key, build):
+    """
+    Devuelve la figura de la sesión asociada a key, o la construye
+    
+    Construir una figura de Plotly (make_subplots, validación de cada traza
+    y anotación) cuesta decenas de milisegundos, mientras que st.plotly_chart
+    no vuelve a validar una figura ya construida. Las figuras se guardan en
+    st.session_state (sin copiarlas ni serializarlas) y se conservan las
+    FIGURE_CACHE_SIZE usadas más recientemente.
+    
+    Args:
+        key (tuple): Todo lo que determina la figura (registro, opciones, zoom)
+        build (callable): Función sin argumentos que construye la figura
+        
+    Returns:
+        plotly.graph_objects.Figure: Figura construida o reutilizada
+    """
+    cache = st.session_state.setdefault("figure_cache", OrderedDict())
+    fig = cache.get(key)
+    if fig is None:
+        fig = build()
+        cache[key] = fig
+        if len(cache) > FIGURE_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return fig
+
+@st.cache_resource
+def _process_temp_dir(name):
+    """
+    Crea un directorio temporal propio del proceso del servidor
+    
+    El directorio se borra al terminar el proceso, de modo que los archivos
+    generados no se acumulan en el directorio temporal del sistema.
+    
+    Args:
+        name (str): Nombre que identifica el uso del directorio
+        
+    Returns:
+        Path: Ruta al directorio
+    """
+    path = tempfile.mkdtemp(prefix=f"acel_{name}_")
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return Path(path)
+
+def _report_code_version():
+    """
+    Calcula una huella del código que genera los reportes
+    
+    Forma parte de la clave de la caché de reportes: un cambio en el código o
+    en la plantilla no sirve reportes generados con la versión anterior.
+    
+    Returns:
+        str: Huella de los módulos de REPORT_SOURCES
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for name in REPORT_SOURCES:
+        digest.update(Path(__file__).with_name(name).read_bytes())
+    return digest.hexdigest()
+
+@st.cache_data(show_spinner=False, max_entries=RECORD_STORE_SIZE)
+def _load_and_process(file_path, metadata_path, fingerprint):
+    """
+    Lee un archivo de datos sísmicos y calcula velocidad, desplazamiento y vector suma
+    
+    El resultado queda en caché de Streamlit, de modo que los cambios en la interfaz
+    (zoom, unidades, tipo de dato) no vuelven a leer ni a integrar el registro.
+    
+    Args:
+        file_path (str): Ruta al archivo de datos
+        metadata_path (str): Ruta al archivo de metadatos (.ss) o None
+        fingerprint (tuple): Huella del contenido de los archivos (clave de caché)
+        
+    Returns:
+        Mapping: Datos del registro procesados, con las series respaldadas en disco
+    """
+    # Obtener el lector adecuado para el tipo de archivo
+    reader = get_reader_for_file(file_path)
+    data = reader.read_data()
+    
+    # Convertir las componentes a float32 contiguo: la precisión basta para la
+    # integración y la visualización, y se reduce a la mitad el tráfico de memoria.
+    # El vector de tiempo se mantiene en float64 para no perder resolución en
+    # registros largos (dt se calcula a partir de él).
+    for component in data['components']:
+        data[component] = np.ascontiguousarray(data[component], dtype=np.float32)
+    
+    # Asignar nombre del archivo
+    data['name'] = os.path.basename(file_path)
+    data['fingerprint'] = fingerprint
+    
+    # Procesar datos para obtener velocidad y desplazamiento
+    sampling_rate = float(data['metadata'].get('sampling_rate', 100))
+    signal_processor = _get_signal_processor(sampling_rate)
+    
+    # Procesar cada componente
+    for component in data['components']:
+        # La aceleración original se comparte sin copia entre la componente y
+        # su clave '_aceleracion'; se marca de solo lectura para que ningún paso
+        # posterior pueda modificarla en su lugar
+        acceleration = data[component]
+        acceleration.flags.writeable = False
+        processed_data = signal_processor.process_acceleration_data(
+            acceleration, 
+            data['time']
+        )
+        data[f'{component}_aceleracion'] = acceleration
+        data[f'{component}_velocidad'] = processed_data['velocity']
+        data[f'{component}_desplazamiento'] = processed_data['displacement']
+    
+    # Pico absoluto (índice y valor con signo) de cada serie, reutilizado por
+    # los rangos de los ejes, las anotaciones y las estadísticas
+    data['peaks'] = {}
+    for data_type in ['aceleracion', 'velocidad', 'desplazamiento']:
+        fields = [f'{component}_{data_type}' for component in data['components']]
+        if len(data['components']) > 1:
+            # Vector suma (magnitud resultante) y picos en una sola pasada
+            magnitude, peaks = magnitude_and_peaks([data[field] for field in fields])
+            data[f'vector_suma_{data_type}'] = magnitude
+            fields.append(f'vector_suma_{data_type}')
+        else:
+            peaks = [abs_argmax(data[fields[0]])]
+        data['peaks'].update(zip(fields, peaks))
+    
+    # Las series se guardan en disco y se leen bajo demanda (memory-map), de
+    # modo que solo el registro que se está mirando ocupa memoria
+    record_key = hashlib.blake2b(repr(fingerprint).encode(), digest_size=16).hexdigest()
+    return store_record(data, _process_temp_dir("registros"), record_key, max_files=RECORD_STORE_SIZE)
+
+@functools.lru_cache(maxsize=16)
+def _fft_frequencies(n, dt):
+    """
+    Devuelve el eje de frecuencias de la FFT real (compartido, de solo lectura)
+    
+    Las componentes de un registro comparten longitud e intervalo de muestreo,
+    por lo que el eje se calcula una sola vez para todas ellas.
+    
+    Args:
+        n (int): Longitud de la transformada
+        dt (float): Intervalo de muestreo en segundos
+        
+    Returns:
+        numpy.array: Frecuencias en Hz
+    """
+    xf = rfftfreq(n, dt)
+    xf.flags.writeable = False
+    return xf
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _compute_fft(signal, dt):
+    """
+    Calcula el espectro de amplitud de Fourier de una o varias señales reales
+    
+    Usa la FFT real (solo frecuencias no negativas) sobre una longitud
+    rápida, con todos los núcleos disponibles. Si pyFFTW está instalado se
+    usa FFTW, que guarda los planes entre llamadas; si no, pocketfft de SciPy.
+    Los registros largos se transforman en la GPU cuando hay CuPy y CUDA.
+    Con un array 2-D (una señal por fila) todas las filas se transforman en
+    una sola llamada, que reparte las filas entre los núcleos.
+    
+    Args:
+        signal (numpy.array): Señal de entrada, o array (n_señales, n_muestras)
+        dt (float): Intervalo de muestreo en segundos
+        
+    Returns:
+        tuple: Frecuencias y amplitudes del espectro (una fila por señal)
+    """
+    # Transformada en simple precisión (complex64): basta para el espectro
+    # mostrado y mueve la mitad de bytes que en float64
+    signal = np.asarray(signal, dtype=np.float32)
+    N = signal.shape[-1]
+    n = next_fast_len(N, real=True)
+    
+    xf = _fft_frequencies(n, float(dt))
+    
+    # Normalizar por el número de muestras originales (el relleno no aporta energía)
+    scale = np.float32(2.0 / N)
+    
+    if CUPY_AVAILABLE and signal.size >= GPU_FFT_MIN_SAMPLES:
+        yf = cp.fft.rfft(cp.asarray(signal), n=n, axis=-1)
+        return xf, cp.asnumpy(scale * cp.abs(yf))
+    
+    if PYFFTW_AVAILABLE:
+        # Copiar a un buffer alineado a 32 bytes (ya con el relleno de ceros)
+        # para que FFTW use sus núcleos SIMD con cargas alineadas
+        buf = pyfftw.empty_aligned(signal.shape[:-1] + (n,), dtype='float32', n=32)
+        buf[..., :N] = signal
+        buf[..., N:] = 0.0
+        yf = fftw_fft.rfft(buf, axis=-1, workers=os.cpu_count())
+    else:
+        yf = rfft(signal, n=n, axis=-1, workers=-1)
+    return xf, scale * np.abs(yf)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _compute_response_spectrum(acceleration, time, sampling_rate, periods):
+    """
+    Calcula el espectro de respuesta de una componente
+    
+    El resultado queda en caché, de modo que generar de nuevo el reporte
+    con otras opciones no repite la integración de los osciladores.
+    
+    Args:
+        acceleration (numpy.array): Datos de aceleración
+        time (numpy.array): Vector de tiempo
+        sampling_rate (float): Frecuencia de muestreo en Hz
+        periods (numpy.array): Periodos para calcular la respuesta
+        
+    Returns:
+        dict: Periodos y espectros de respuesta (Sa, Sv, Sd)
+    """
+    signal_processor = _get_signal_processor(sampling_rate)
+    return signal_processor.compute_response_spectrum(acceleration, time, periods=periods)
+
+@st.cache_data(show_spinner=False)
+def _metadata_table(metadata_items):
+    """
+    Construye la tabla de metadatos de un registro en formato Arrow
+    
+    Args:
+        metadata_items (tuple): Pares (campo, valor) de los metadatos
+        
+    Returns:
+        pyarrow.Table: Tabla con las columnas Campo y Valor
+    """
+    keys = [str(key) for key, _ in metadata_items]
+    # Los valores se convierten a texto: Arrow exige un tipo único por columna
+    values = [str(value) for _, value in metadata_items]
+    return pa.table({'Campo': keys, 'Valor': values})
+
+def _load_selected_file(file_path, metadata_path):
+    """
+    Carga un registro seleccionado usando la caché de registros procesados
+    
+    Args:
+        file_path (str): Ruta al archivo de datos
+        metadata_path (str): Ruta al archivo de metadatos (.ss) o None
+        
+    Returns:
+        dict: Datos del registro procesados
+    """
+    # La huella incluye el .ss para invalidar la caché si cambian los metadatos
+    fingerprint = tuple(
+        _file_fingerprint(path)
+        for path in (file_path, metadata_path) if path
+    )
+    record = _load_and_process(file_path, metadata_path, fingerprint)
+    # Si el archivo del registro ya no está en disco (descartado por el límite
+    # del almacén o borrado desde fuera) se vuelve a procesar
+    if isinstance(record, LazyRecord) and not record.touch():
+        _load_and_process.clear(file_path, metadata_path, fingerprint)
+        record = _load_and_process(file_path, metadata_path, fingerprint)
+    return record
+
+@st.fragment
+def _render_individual_view(all_data):
+    """
+    Muestra la vista individual de los registros (pestaña 1)
+    
+    Se ejecuta como fragmento: sus controles solo vuelven a ejecutar esta
+    función, sin releer los archivos ni redibujar las demás pestañas.
+    
+    Args:
+        all_data (list): Registros cargados
+    """
+    st.markdown("""
+        <div class='info-container'>
+            <h2>Vista Individual</h2>
+            <p>Visualiza los registros de aceleración, velocidad y desplazamiento para cada componente.</p>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Selector de registro
+    selected_data_index = st.selectbox(
+        "Seleccionar registro", 
+        range(len(all_data)), 
+        format_func=lambda i: all_data[i]['name']
+    )
+    data = all_data[selected_data_index]
+    
+    # Duración y metadatos del registro, leídos una vez para las métricas
+    # y los controles de zoom
+    duration = float(data['time'][-1])
+    metadata = data['metadata']
+    
+    # Mostrar metadatos
+    with st.expander("Metadatos", expanded=True):
+        metadata_table = _metadata_table(tuple(metadata.items()))
+        st.dataframe(metadata_table, use_container_width=True)
+    
+    # Mostrar información relevante con mejor diseño
+    st.markdown("<h4 style='margin: 1rem 0;'>Información del Registro</h4>", unsafe_allow_html=True)
+    cols = st.columns(4)
+    with cols[0]:
+        st.metric(
+            "Frecuencia de muestreo",
+            f"{metadata.get('sampling_rate', 'N/A')} Hz",
+            help="Frecuencia de muestreo del registro"
+        )
+    with cols[1]:
+        st.metric(
+            "Sensor",
+            metadata.get('sensor_name', 'N/A'),
+            help="Nombre del sensor utilizado"
+        )
+    with cols[2]:
+        st.metric(
+            "Unidades",
+            metadata.get('unit', 'm/s/s'),
+            help="Unidades de medición"
+        )
+    with cols[3]:
+        st.metric(
+            "Duración",
+            f"{duration:.2f} s",
+            help="Duración total del registro"
+        )
+        
+    # Agregar controles de zoom sincronizados
+    st.markdown("<h4 style='margin: 1rem 0;'>Controles de Visualización</h4>", unsafe_allow_html=True)
+    zoom_cols = st.columns(2)
+    with zoom_cols[0]:
+        zoom_start = st.number_input(
+            "Tiempo inicial (s)",
+            0.0,
+            duration,
+            0.0,
+            help="Selecciona el tiempo inicial para el zoom"
+        )
+    with zoom_cols[1]:
+        zoom_end = st.number_input(
+            "Tiempo final (s)",
+            zoom_start,
+            duration,
+            duration,
+            help="Selecciona el tiempo final para el zoom"
+        )
+    
+    # Opciones de visualización: dentro del fragmento (no en la barra lateral)
+    # para que al cambiarlas solo se vuelva a dibujar esta vista
+    option_cols = st.columns(4)
+    with option_cols[0]:
+        # Selector de unidades de visualización
+        display_unit = st.radio(
+            "Seleccionar unidad:",
+            ["m/s²", "g (9.81 m/s²)"],
+            horizontal=True,
+            key="display_unit_tab1"
+        )
+    with option_cols[1]:
+        # Selector de tipo de datos a visualizar
+        data_type = st.radio(
+            "Tipo de datos:",
+            ["Aceleración", "Velocidad", "Desplazamiento"],
+            horizontal=True,
+            key="data_type_tab1"
+        )
+    with option_cols[2]:
+        # Resolución de los gráficos: por defecto se reduce cada traza con LTTB
+        high_detail = st.checkbox(
+            "Graficar en alta resolución",
+            value=False,
+            help="Envía todas las muestras a los gráficos. Puede ser lento en registros largos.",
+            key="high_detail_tab1"
+        )
+    with option_cols[3]:
+        # Gráficos sin interacción: plotly.js no instala la barra de herramientas
+        # ni los manejadores de hover y zoom, y dibuja antes en registros largos
+        static_plots = st.checkbox(
+            "Gráficos estáticos",
+            value=False,
+            help="Desactiva la interacción con los gráficos (hover, zoom con el ratón). Los controles de zoom siguen disponibles.",
+            key="static_plots_tab1"
+        )
+    
+    # Factor de conversión según la unidad seleccionada
+    conversion_factor = 1.0 if display_unit == "m/s²" else 1.0/9.81
+    
+    # Etiquetas de unidades según el tipo de datos
+    if data_type == "Aceleración":
+        unit_label = "m/s²" if display_unit == "m/s²" else "g"
+        title_prefix = "Aceleración"
+        data_field_suffix = "aceleracion"
+    elif data_type == "Velocidad":
+        unit_label = "m/s"
+        title_prefix = "Velocidad"
+        data_field_suffix = "velocidad"
+    else:  # Desplazamiento
+        unit_label = "m"
+        title_prefix = "Desplazamiento"
+        data_field_suffix = "desplazamiento"
+    
+    # Configuración común para todos los gráficos
+    if static_plots:
+        graph_config = {"staticPlot": True, "displayModeBar": False}
+    else:
+        graph_config = {
+            "displayModeBar": True,
+            "displaylogo": False,
+            "modeBarButtonsToRemove": ["lasso2d", "select2d"],
+            "modeBarButtonsToAdd": [
+                "drawopenpath",
+                "eraseshape",
+                "zoomIn2d",
+                "zoomOut2d",
+                "autoScale2d"
+            ],
+            "toImageButtonOptions": {
+                "format": "png",
+                "filename": "grafico",
+                "height": 800,
+                "width": 1200,
+                "scale": 2
+            }
+        }
+
+    # Configuración común del layout
+    layout_config = {
+        "height": 350,
+        "margin": dict(l=50, r=20, t=40, b=30),
+        "showlegend": True,
+        "legend": dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="right",
+            x=0.99,
+            bgcolor="rgba(255, 255, 255, 0.5)",
+            bordercolor="rgba(128, 128, 128, 0.3)",
+            borderwidth=1
+        ),
+        "xaxis": dict(
+            range=[zoom_start, zoom_end],
+            rangeslider=dict(visible=True, thickness=0.1),
+            title="Tiempo (s)",
+            gridcolor="rgba(128, 128, 128, 0.2)",
+            showgrid=True,
+            zeroline=True,
+            zerolinecolor="rgba(0, 0, 0, 0.3)",
+            zerolinewidth=1
+        ),
+        "plot_bgcolor": "rgba(0, 0, 0, 0)",
+        "paper_bgcolor": "rgba(0, 0, 0, 0)"
+    }
+
+    # Color de cada componente del registro, resuelto una vez
+    comp_colors = {
+        component: COLORS.get(component, DEFAULT_COLOR)
+        for component in data['components']
+    }
+
+    # Crear gráficos para cada componente con la nueva configuración
+    st.markdown("""
+        <div class='info-container'>
+            <h3 style='margin: 0;'>Visualización de Componentes</h3>
+            <p style='margin: 0.5rem 0 0 0;'>Gráficos detallados de cada componente del registro sísmico.</p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    # Todo lo que determina las figuras de esta vista: al repetirse (cambio de
+    # pestaña u otros widgets) se reutilizan las figuras ya construidas
+    figure_key = (
+        data['name'], data['fingerprint'], data_field_suffix, display_unit,
+        high_detail, zoom_start, zoom_end
+    )
+    
+    def build_components_figure():
+        # Un único gráfico con una fila por componente y el eje de tiempo compartido:
+        # el navegador crea una sola instancia de Plotly en lugar de una por componente
+        n_rows = len(data['components'])
+        fig_comp = make_subplots(
+            rows=n_rows,
+            cols=1,
+            shared_xaxes=True,
+            vertical_spacing=0.08,
+            subplot_titles=[
+                f"<b>{title_prefix} - Componente {component}</b>"
+                for component in data['components']
+            ]
+        )
+        
+        for row, component in enumerate(data['components'], start=1):
+            # Clave y color se resuelven una sola vez por componente
+            field = f'{component}_{data_field_suffix}'
+            color = comp_colors[component]
+            x_plot, y_plot = _series_for_plot(
+                data, field, conversion_factor, high_detail, (zoom_start, zoom_end)
+            )
+            fig_comp.add_trace(go.Scattergl(
+                x=x_plot,
+                y=y_plot,
+                mode='lines',
+                name=component,
+                line=dict(
+                    color=color,
+                    width=2,
+                    shape='linear'
+                ),
+                hovertemplate="<b>Tiempo:</b> %{x:.2f}s<br><b>Valor:</b> %{y:.3f} " + unit_label
+            ), row=row, col=1)
+            
+            # Configuración específica para el componente
+            max_idx, peak_value = data['peaks'][field]
+            max_val = abs(peak_value) * conversion_factor * 1.2
+            fig_comp.update_yaxes(
+                title=dict(
+                    text=f"{title_prefix} ({unit_label})",
+                    standoff=10
+                ),
+                range=[-max_val, max_val],
+                gridcolor="rgba(128, 128, 128, 0.2)",
+                showgrid=True,
+                zeroline=True,
+                zerolinecolor="rgba(0, 0, 0, 0.3)",
+                zerolinewidth=1,
+                row=row,
+                col=1
+            )
+            
+            # Agregar anotaciones para valores máximos y mínimos
+            max_time = data['time'][max_idx]
+            max_value = peak_value * conversion_factor
+            
+            fig_comp.add_annotation(
+                x=max_time,
+                y=max_value,
+                text=f"Max: {max_value:.2f} {unit_label}",
+                showarrow=True,
+                arrowhead=2,
+                arrowsize=1,
+                arrowwidth=2,
+                arrowcolor=color,
+                bgcolor="rgba(0, 0, 0, 0)",
+                bordercolor=color,
+                borderwidth=1,
+                borderpad=4,
+                font=dict(size=10, color=color),
+                row=row,
+                col=1
+            )
+        
+        # Layout común, con la altura de una fila por componente. Todos los ejes de
+        # tiempo usan el rango del zoom; el título y el rangeslider van en el inferior
+        layout_comp = layout_config.copy()
+        xaxis_config = layout_comp.pop("xaxis")
+        layout_comp["height"] = layout_config["height"] * n_rows
+        fig_comp.update_layout(**layout_comp)
+        fig_comp.update_xaxes(**{
+            key: value for key, value in xaxis_config.items()
+            if key not in ("rangeslider", "title")
+        })
+        fig_comp.update_xaxes(
+            title=xaxis_config["title"],
+            rangeslider=xaxis_config["rangeslider"],
+            row=n_rows,
+            col=1
+        )
+            
+        return fig_comp
+    
+    fig_comp = _cached_figure(("componentes",) + figure_key, build_components_figure)
+    st.plotly_chart(fig_comp, use_container_width=True, config=graph_config)
+    
+    # Vector Suma (si hay más de una componente)
+    if len(data['components']) > 1:
+        def build_suma_figure():
+            field = f'vector_suma_{data_field_suffix}'
+            color = COLORS["vector_suma"]
+            x_plot, y_plot = _series_for_plot(
+                data, field, conversion_factor, high_detail, (zoom_start, zoom_end)
+            )
+            trace = go.Scattergl(
+                x=x_plot,
+                y=y_plot,
+                mode='lines',
+                name="Vector Suma",
+                line=dict(
+                    color=color,
+                    width=2,
+                    shape='linear'
+                ),
+                hovertemplate="<b>Tiempo:</b> %{x:.2f}s<br><b>Valor:</b> %{y:.3f} " + unit_label
+            )
+            
+            # El vector suma es no negativo: su pico absoluto es su máximo
+            max_idx_suma, peak_suma = data['peaks'][field]
+            max_val_suma = peak_suma * conversion_factor * 1.2
+            max_time_suma = data['time'][max_idx_suma]
+            max_value_suma = peak_suma * conversion_factor
+            
+            # Figura construida con su layout en una sola llamada (Plotly valida
+            # una vez en lugar de al actualizar el layout y al anotar)
+            fig_suma = go.Figure(data=[trace], layout=dict(
+                title=dict(
+                    text=f"<b>Magnitud Resultante ({title_prefix})</b>",
+                    x=0.5,
+                    xanchor='center',
+                    font=dict(size=16)
+                ),
+                **layout_config,
+                yaxis=dict(
+                    title=dict(
+                        text=f"{title_prefix} ({unit_label})",
+                        standoff=10
+                    ),
+                    range=[0, max_val_suma],
+                    gridcolor="rgba(128, 128, 128, 0.2)",
+                    showgrid=True,
+                    zeroline=True,
+                    zerolinecolor="rgba(0, 0, 0, 0.3)",
+                    zerolinewidth=1
+                ),
+                # Anotación para el valor máximo
+                annotations=[dict(
+                    x=max_time_suma,
+                    y=max_value_suma,
+                    text=f"Max: {max_value_suma:.2f} {unit_label}",
+                    showarrow=True,
+                    arrowhead=2,
+                    arrowsize=1,
+                    arrowwidth=2,
+                    arrowcolor=color,
+                    bgcolor="rgba(0, 0, 0, 0)",
+                    bordercolor=color,
+                    borderwidth=1,
+                    borderpad=4,
+                    font=dict(size=10, color=color)
+                )]
+            ))
+            
+            return fig_suma
+        
+        fig_suma = _cached_figure(("vector_suma",) + figure_key, build_suma_figure)
+        st.plotly_chart(fig_suma, use_container_width=True, config=graph_config)
+    
+    # Opciones adicionales para análisis
+    st.subheader("Opciones adicionales para análisis")
+    
+    # Selector de componentes para el gráfico individual
+    available_components = data['components'] + ['vector_suma'] if len(data['components']) > 1 else data['components']
+    components = st.multiselect(
+        "Seleccionar componentes para visualizar juntos:",
+        available_components,
+        default=data['components'],
+        key="components_tab1"
+    )
+    
+    # Crear gráfico individual con todos los componentes seleccionados
+    if components:
+        def build_selected_figure():
+            # Las trazas se reúnen en una lista y se entregan juntas a la figura.
+            # El rango del eje Y se basa en el máximo valor absoluto de cada traza
+            traces = []
+            max_vals = []
+            for component in components:
+                field = f'{component}_{data_field_suffix}'
+                x_plot, y_plot = _series_for_plot(
+                    data, field, conversion_factor, high_detail, (zoom_start, zoom_end)
+                )
+                traces.append(go.Scattergl(
+                    x=x_plot,
+                    y=y_plot,
+                    mode='lines',
+                    name=component,
+                    line=dict(color=COLORS.get(component, DEFAULT_COLOR))
+                ))
+                _, peak_value = data['peaks'][field]
+                max_vals.append(abs(peak_value) * conversion_factor)
+
+            y_max = max(max_vals) * 1.2  # Ampliar el valor máximo para el rango
+
+            # Figura construida con su configuración en una sola llamada
+            fig1 = go.Figure(data=traces, layout=dict(
+                title=dict(
+                    text=f"<b>Registro de {title_prefix} - {data['name']}</b>",
+                    x=0.5,
+                    xanchor='center',
+                    font=dict(size=16)
+                ),
+                xaxis=dict(
+                    rangeslider=dict(visible=True, thickness=0.1),
+                    type="linear",
+                    range=[zoom_start, zoom_end],
+                    title="Tiempo (s)",
+                    gridcolor="rgba(128, 128, 128, 0.2)",
+                    showgrid=True,
+                    zeroline=True,
+                    zerolinecolor="rgba(0, 0, 0, 0.3)",
+                    zerolinewidth=1
+                ),
+                yaxis=dict(
+                    title=dict(
+                        text=f"{title_prefix} ({unit_label})",
+                        standoff=10
+                    ),
+                    exponentformat='e',
+                    showexponent='all',
+                    tickformat='.2e',
+                    range=[-y_max, y_max],  # Rango simétrico
+                    gridcolor="rgba(128, 128, 128, 0.2)",
+                    showgrid=True,
+                    zeroline=True,
+                    zerolinecolor="rgba(0, 0, 0, 0.3)",
+                    zerolinewidth=1
+                ),
+                showlegend=True,
+                legend=dict(
+                    yanchor="top",
+                    y=0.99,
+                    xanchor="right",
+                    x=0.99,
+                    bgcolor="rgba(255, 255, 255, 0.5)",
+                    bordercolor="rgba(128, 128, 128, 0.3)",
+                    borderwidth=1
+                ),
+                height=600,
+                margin=dict(l=50, r=20, t=40, b=30),
+                plot_bgcolor="rgba(0, 0, 0, 0)",
+                paper_bgcolor="rgba(0, 0, 0, 0)"
+            ))
+                
+            return fig1
+        
+        fig1 = _cached_figure(("seleccion", tuple(components)) + figure_key, build_selected_figure)
+        st.plotly_chart(fig1, use_container_width=True, config=graph_config)
+        
+    # Estadísticas básicas
+    with st.expander("Estadísticas", expanded=True):
+        stats_data = []
+        for component in data['components']:
+            field = f'{component}_{data_field_suffix}'
+            y_stats = summary_stats(data[field])
+            stats = {
+                "Componente": component,
+                "Valor Máximo": abs(data['peaks'][field][1]),
+                "Valor Mínimo": y_stats['min'],
+                "Media": y_stats['mean'],
+                "Desviación Estándar": y_stats['std'],
+                "RMS": y_stats['rms']
+            }
+            stats_data.append(stats)
+            
+        if len(data['components']) > 1:
+            field = f'vector_suma_{data_field_suffix}'
+            y_stats = summary_stats(data[field])
+            stats = {
+                "Componente": "Vector Suma",
+                "Valor Máximo": data['peaks'][field][1],
+                "Valor Mínimo": y_stats['min'],
+                "Media": y_stats['mean'],
+                "Desviación Estándar": y_stats['std'],
+                "RMS": y_stats['rms']
+            }
+            stats_data.append(stats)
+        
+        stats_df = pd.DataFrame(stats_data)
+        st.dataframe(stats_df, use_container_width=True)
+
+@st.fragment
+def _render_reports(all_data):
+    """
+    Muestra la generación de reportes automáticos (pestaña 8)
+    
+    Se ejecuta como fragmento, igual que la vista individual.
+    
+    Args:
+        all_data (list): Registros cargados
+    """
+    st.markdown("""
+        <div class='info-container'>
+            <h2>Reportes Automáticos</h2>
+            <p>Genera reportes automáticos con los resultados del análisis.</p>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Selector de registro
+    selected_data_index = st.selectbox(
+        "Seleccionar registro para el reporte", 
+        range(len(all_data)), 
+        format_func=lambda i: all_data[i]['name'],
+        key="report_data_selector"
+    )
+    data = all_data[selected_data_index]
+    
+    # Las opciones se agrupan en un formulario: cambiarlas no vuelve a
+    # ejecutar la aplicación hasta que se pulsa "Generar Reporte"
+    with st.form("report_form", clear_on_submit=False):
+        # Opciones del reporte
+        st.subheader("Opciones del Reporte")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            include_metadata = st.checkbox("Incluir metadatos", value=True)
+            include_time_series = st.checkbox("Incluir series de tiempo", value=True)
+            include_fft = st.checkbox("Incluir análisis espectral", value=True)
+        
+        with col2:
+            include_response_spectrum = st.checkbox("Incluir espectro de respuesta", value=True)
+            include_stats = st.checkbox("Incluir estadísticas", value=True)
+            include_events = st.checkbox("Incluir detección de eventos", value=False)
+        
+        # Formato del reporte
+        report_format = st.selectbox(
+            "Formato del reporte",
+            ["PDF", "HTML", "DOCX"],
+            index=0
+        )
+        
+        # Botón para generar reporte
+        generate_report = st.form_submit_button("Generar Reporte")
+    
+    report_options = {
+        'include_metadata': include_metadata,
+        'include_time_series': include_time_series,
+        'include_fft': include_fft,
+        'include_response_spectrum': include_response_spectrum,
+        'include_stats': include_stats,
+        'include_events': include_events
+    }
+    
+    # Sin secciones seleccionadas no hay nada que calcular ni que generar
+    if generate_report and not any(report_options.values()):
+        st.warning("Seleccione al menos una sección para incluir en el reporte.")
+    elif generate_report:
+        with st.spinner("Generando reporte..."):
+            try:
+                # Un reporte ya generado para el mismo contenido, opciones y formato
+                # se sirve desde disco sin recalcular ni volver a generarlo
+                extension = report_format.lower()
+                report_key = hashlib.blake2b(
+                    repr((
+                        data['name'], data['fingerprint'], sorted(report_options.items()),
+                        extension, _report_code_version()
+                    )).encode(),
+                    digest_size=8
+                ).hexdigest()
+                report_dir = _process_temp_dir("reportes")
+                report_file = report_dir / f"{report_key}.{extension}"
+                
+                if report_file.exists():
+                    # Marcar el reporte como usado recientemente (ver prune_store)
+                    os.utime(report_file)
+                else:
+                    # Calcular resultados de análisis necesarios para el reporte
+                    analysis_results = {}
+                    
+                    # Calcular FFT si se solicita
+                    if include_fft:
+                        T = data['time'][1] - data['time'][0]  # Intervalo de tiempo
+                        
+                        # Calcular la FFT de todas las componentes en una sola llamada
+                        # sobre el array (n_componentes, n_muestras) (en caché entre reruns)
+                        signals = np.stack([data[f'{component}_aceleracion'] for component in data['components']])
+                        xf, amplitudes = _compute_fft(signals, T)
+                        
+                        # Frecuencias comunes y una fila de amplitudes por componente
+                        analysis_results['fft_freq'] = xf
+                        analysis_results['fft_amp'] = amplitudes
+                        analysis_results['fft_components'] = tuple(data['components'])
+                    
+                    # Calcular espectro de respuesta si se solicita
+                    if include_response_spectrum:
+                        analysis_results['response_spectrum'] = {}
+                        
+                        # Calcular las componentes en paralelo (en caché entre reruns)
+                        sampling_rate = float(data['metadata'].get('sampling_rate', 100))
+                        with _script_thread_pool(len(data['components'])) as executor:
+                            spectra = list(executor.map(
+                                lambda component: _compute_response_spectrum(
+                                    data[f'{component}_aceleracion'],
+                                    data['time'],
+                                    sampling_rate,
+                                    RESPONSE_SPECTRUM_PERIODS
+                                ),
+                                data['components']
+                            ))
+                        
+                        for component, spectrum in zip(data['components'], spectra):
+                            analysis_results['response_spectrum'][component] = spectrum
+                    
+                    # Detectar eventos (STA/LTA) en cada componente si se solicita
+                    if include_events:
+                        from event_detector import EventDetector
+                        detector = EventDetector(float(data['metadata'].get('sampling_rate', 100)))
+                        analysis_results['events'] = {
+                            component: detector.sta_lta(data[f'{component}_aceleracion'])[0]
+                            for component in data['components']
+                        }
+                    
+                    # Generar el reporte. Importación diferida: report_generator
+                    # carga matplotlib (más de medio segundo), que solo se usa aquí
+                    from report_generator import ReportGenerator
+                    report_generator = ReportGenerator()
+                    try:
+                        report_generator.generate_report(
+                            data, 
+                            analysis_results,
+                            output_format=extension,
+                            options=report_options,
+                            output_path=report_file
+                        )
+                    except Exception:
+                        # Un reporte a medio escribir no debe quedar en la caché
+                        report_file.unlink(missing_ok=True)
+                        raise
+                    prune_store(report_dir, REPORT_CACHE_SIZE, pattern="*.*")
+                    
+                # Preparar descarga
+                mime_type = {
+                    'pdf': 'application/pdf',
+                    'html': 'text/html',
+                    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+                }[extension]
+                
+                file_name = f"reporte_{data['name'].split('.')[0]}.{extension}"
+                
+                # Se entrega el archivo abierto, sin codificar en base64: Streamlit
+                # lo lee directamente hacia su almacén de descargas
+                with open(report_file, "rb") as report:
+                    st.download_button(
+                        f"Descargar Reporte {report_format}",
+                        data=report,
+                        file_name=file_name,
+                        mime=mime_type
+                    )
+                
+                st.success(f"Reporte generado correctamente en formato {report_format}")
+            
+            except Exception as e:
+                st.error(f"Error al generar el reporte: {str(e)}")
 
 def main():
     st.title("Visor de Acelerógrafos")
@@ -178,16 +1359,19 @@ def main():
     # Sidebar para configuración
     st.sidebar.header("Configuración")
     
-    # Crear directorio temporal para archivos subidos
-    upload_dir = Path("uploads")
+    # Directorio temporal propio de la sesión para los archivos subidos: las
+    # sesiones simultáneas no comparten archivos. Se conserva entre reruns
+    # (cada subida se escribe en disco una sola vez) y se elimina cuando la
+    # sesión termina y su estado se libera (o al cerrar el servidor)
+    if "upload_dir" not in st.session_state:
+        st.session_state["upload_dir"] = tempfile.TemporaryDirectory(
+            prefix="acel_", ignore_cleanup_errors=True
+        )
+    upload_dir = Path(st.session_state["upload_dir"].name)
     upload_dir.mkdir(exist_ok=True)
     
-    # Limpiar directorio temporal al inicio
-    for file in upload_dir.glob("*"):
-        if file.is_file():
-            file.unlink()
-        elif file.is_dir():
-            shutil.rmtree(file)
+    # Subidas ya escritas en disco en esta sesión: {nombre: file_id}
+    written_uploads = st.session_state.setdefault("written_uploads", {})
     
     # Selector de método de carga
     st.sidebar.markdown("### Cargar Datos")
@@ -205,35 +1389,38 @@ def main():
         )
         
         if zip_file:
-            # Crear directorio temporal para extracción
+            # Directorio de extracción
             extract_dir = upload_dir / "extracted"
-            extract_dir.mkdir(exist_ok=True)
-            
-            # Mostrar mensaje de progreso
-            with st.sidebar.status("Extrayendo archivos..."):
-                # Extraer contenido del ZIP
-                with zipfile.ZipFile(io.BytesIO(zip_file.read())) as z:
-                    z.extractall(extract_dir)
-                st.sidebar.success(f"ZIP extraído correctamente: {len(z.namelist())} archivos")
             
-            # Buscar archivos en la estructura extraída
-            supported_extensions = [".ms", ".sac", ".mseed", ".miniseed", ".sgy", ".segy", ".txt", ".csv", ".dat", ".asc"]
-            data_paths = []
-            
-            for ext in supported_extensions:
-                data_paths.extend(list(extract_dir.rglob(f"*{ext}")))
+            # Extraer solo si el ZIP es nuevo; en los reruns siguientes se
+            # reutilizan los archivos ya extraídos
+            if written_uploads.get(extract_dir.name) != zip_file.file_id or not extract_dir.exists():
+                shutil.rmtree(upload_dir, ignore_errors=True)
+                extract_dir.mkdir(parents=True)
+                written_uploads.clear()
+                
+                # Mostrar mensaje de progreso
+                with st.sidebar.status("Extrayendo archivos..."):
+                    # Leer el ZIP directamente desde el archivo subido (admite seek) y
+                    # extraer solo los archivos de datos y sus metadatos .ss
+                    extensions = DATA_EXTENSIONS | {".ss"}
+                    zip_file.seek(0)
+                    with zipfile.ZipFile(zip_file) as z:
+                        members = [
+                            info for info in z.infolist()
+                            if not info.is_dir() and Path(info.filename).suffix.lower() in extensions
+                        ]
+                        # z.extract devuelve la ruta de cada archivo extraído
+                        st.session_state["extracted_files"] = [
+                            Path(z.extract(info, extract_dir)) for info in members
+                        ]
+                written_uploads[extract_dir.name] = zip_file.file_id
             
-            # Para archivos .ms, buscar sus correspondientes .ss
-            ms_paths = list(extract_dir.rglob("*.ms"))
-            for ms_path in ms_paths:
-                ss_path = ms_path.with_suffix(".ss")
-                if ss_path.exists():
-                    data_files.append((str(ms_path), str(ss_path)))
+            extracted = st.session_state["extracted_files"]
+            st.sidebar.success(f"ZIP extraído correctamente: {len(extracted)} archivos")
             
-            # Para otros formatos, no necesitan archivo de metadatos separado
-            for path in data_paths:
-                if path.suffix != ".ms" and path.suffix != ".ss":  # Evitar duplicados
-                    data_files.append((str(path), None))
+            # Agrupar los archivos extraídos, sin volver a recorrer el directorio
+            data_files = _find_data_files(extracted)
             
             if data_files:
                 st.sidebar.success(f"Se encontraron {len(data_files)} archivos de datos sísmicos")
@@ -251,24 +1438,32 @@ def main():
         )
         
         if uploaded_files:
-            # Guardar archivos subidos en el directorio temporal
-            for uploaded_file in uploaded_files:
-                file_path = upload_dir / uploaded_file.name
-                with open(file_path, "wb") as f:
-                    f.write(uploaded_file.getbuffer())
+            current_uploads = {uploaded_file.name: uploaded_file for uploaded_file in uploaded_files}
             
-            # Buscar pares de archivos .ms y .ss
-            ms_paths = list(upload_dir.glob("*.ms"))
-            for ms_path in ms_paths:
-                ss_path = ms_path.with_suffix(".ss")
-                if ss_path.exists():
-                    data_files.append((str(ms_path), str(ss_path)))
+            # Eliminar lo que ya no forma parte de la subida (archivos quitados o
+            # un ZIP extraído anteriormente)
+            for path in upload_dir.iterdir():
+                if path.name not in current_uploads:
+                    if path.is_dir():
+                        shutil.rmtree(path, ignore_errors=True)
+                    else:
+                        path.unlink(missing_ok=True)
+                    written_uploads.pop(path.name, None)
             
-            # Agregar otros formatos de archivo
-            for ext in [".sac", ".mseed", ".miniseed", ".sgy", ".segy", ".txt", ".csv", ".dat", ".asc"]:
-                paths = list(upload_dir.glob(f"*{ext}"))
-                for path in paths:
-                    data_files.append((str(path), None))
+            # Guardar en el directorio temporal solo las subidas nuevas o reemplazadas
+            file_paths = []
+            for name, uploaded_file in current_uploads.items():
+                file_path = upload_dir / name
+                file_paths.append(file_path)
+                if written_uploads.get(name) == uploaded_file.file_id and file_path.exists():
+                    continue
+                uploaded_file.seek(0)
+                with open(file_path, "wb") as f:
+                    shutil.copyfileobj(uploaded_file, f, length=COPY_BUFFER_SIZE)
+                written_uploads[name] = uploaded_file.file_id
+            
+            # Buscar los registros entre los archivos guardados
+            data_files = _find_data_files(file_paths)
     
     if not data_files:
         st.info("Por favor, sube archivos de datos sísmicos para visualizar. Se soportan los siguientes formatos: MS/SS, SAC, miniSEED, SEG-Y, ASCII (txt, csv, dat, asc).")
@@ -287,50 +1482,21 @@ def main():
         return
 
     try:
-        # Procesar cada archivo seleccionado
+        # Procesar los archivos seleccionados en paralelo (son independientes entre sí)
         all_data = []
-        for file_path, metadata_path in selected_files:
-            try:
-                # Obtener el lector adecuado para el tipo de archivo
-                reader = get_reader_for_file(file_path)
-                data = reader.read_data()
-                
-                # Asignar nombre del archivo
-                data['name'] = os.path.basename(file_path)
-                
-                # Procesar datos para obtener velocidad y desplazamiento
-                sampling_rate = float(data['metadata'].get('sampling_rate', 100))
-                signal_processor = SignalProcessor(sampling_rate)
-                
-                # Procesar cada componente
-                for component in data['components']:
-                    processed_data = signal_processor.process_acceleration_data(
-                        data[component], 
-                        data['time']
-                    )
-                    # Guardar los datos originales como aceleración
-                    data[f'{component}_aceleracion'] = data[component]
-                    data[f'{component}_velocidad'] = processed_data['velocity']
-                    data[f'{component}_desplazamiento'] = processed_data['displacement']
-                
-                # Calcular el vector suma (magnitud resultante) para cada tipo de dato
-                if len(data['components']) > 1:  # Solo si hay múltiples componentes
-                    for data_type in ['aceleracion', 'velocidad', 'desplazamiento']:
-                        # Crear un array para almacenar la suma de cuadrados
-                        sum_squares = np.zeros_like(data['time'])
-                        
-                        # Sumar los cuadrados de cada componente
-                        for component in data['components']:
-                            sum_squares += np.power(data[f'{component}_{data_type}'], 2)
-                        
-                        # Calcular la raíz cuadrada
-                        data[f'vector_suma_{data_type}'] = np.sqrt(sum_squares)
-                
-                all_data.append(data)
-                
-            except Exception as e:
-                st.error(f"Error al procesar el archivo {os.path.basename(file_path)}: {str(e)}")
-                continue
+        with _script_thread_pool(min(8, len(selected_files))) as executor:
+            futures = [
+                executor.submit(_load_selected_file, file_path, metadata_path)
+                for file_path, metadata_path in selected_files
+            ]
+            
+            # Recoger los resultados en el orden de selección
+            for (file_path, metadata_path), future in zip(selected_files, futures):
+                try:
+                    all_data.append(future.result())
+                except Exception as e:
+                    st.error(f"Error al procesar el archivo {os.path.basename(file_path)}: {str(e)}")
+                    continue
         
         if not all_data:
             st.error("No se pudo procesar ninguno de los archivos seleccionados.")
@@ -351,534 +1517,10 @@ def main():
         tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = tabs
         
         with tab1:
-            st.markdown("""
-                <div class='info-container'>
-                    <h2>Vista Individual</h2>
-                    <p>Visualiza los registros de aceleración, velocidad y desplazamiento para cada componente.</p>
-                </div>
-            """, unsafe_allow_html=True)
-            
-            # Selector de registro
-            selected_data_index = st.selectbox(
-                "Seleccionar registro", 
-                range(len(all_data)), 
-                format_func=lambda i: all_data[i]['name']
-            )
-            data = all_data[selected_data_index]
-            
-            # Mostrar metadatos
-            with st.expander("Metadatos", expanded=True):
-                metadata_df = pd.DataFrame({
-                    'Campo': list(data['metadata'].keys()),
-                    'Valor': list(data['metadata'].values())
-                })
-                st.dataframe(metadata_df, use_container_width=True)
-            
-            # Mostrar información relevante con mejor diseño
-            st.markdown("<h4 style='margin: 1rem 0;'>Información del Registro</h4>", unsafe_allow_html=True)
-            cols = st.columns(4)
-            with cols[0]:
-                st.metric(
-                    "Frecuencia de muestreo",
-                    f"{data['metadata'].get('sampling_rate', 'N/A')} Hz",
-                    help="Frecuencia de muestreo del registro"
-                )
-            with cols[1]:
-                st.metric(
-                    "Sensor",
-                    data['metadata'].get('sensor_name', 'N/A'),
-                    help="Nombre del sensor utilizado"
-                )
-            with cols[2]:
-                st.metric(
-                    "Unidades",
-                    data['metadata'].get('unit', 'm/s/s'),
-                    help="Unidades de medición"
-                )
-            with cols[3]:
-                st.metric(
-                    "Duración",
-                    f"{data['time'][-1]:.2f} s",
-                    help="Duración total del registro"
-                )
-                
-            # Agregar controles de zoom sincronizados
-            st.markdown("<h4 style='margin: 1rem 0;'>Controles de Visualización</h4>", unsafe_allow_html=True)
-            zoom_cols = st.columns(2)
-            with zoom_cols[0]:
-                zoom_start = st.number_input(
-                    "Tiempo inicial (s)",
-                    0.0,
-                    float(data['time'][-1]),
-                    0.0,
-                    help="Selecciona el tiempo inicial para el zoom"
-                )
-            with zoom_cols[1]:
-                zoom_end = st.number_input(
-                    "Tiempo final (s)",
-                    zoom_start,
-                    float(data['time'][-1]),
-                    float(data['time'][-1]),
-                    help="Selecciona el tiempo final para el zoom"
-                )
-            
-            # Selector de unidades de visualización
-            st.sidebar.subheader("Opciones de Visualización")
-            display_unit = st.sidebar.radio(
-                "Seleccionar unidad:",
-                ["m/s²", "g (9.81 m/s²)"],
-                key="display_unit_tab1"
-            )
-            
-            # Selector de tipo de datos a visualizar
-            data_type = st.sidebar.radio(
-                "Tipo de datos:",
-                ["Aceleración", "Velocidad", "Desplazamiento"],
-                key="data_type_tab1"
-            )
-            
-            # Factor de conversión según la unidad seleccionada
-            conversion_factor = 1.0 if display_unit == "m/s²" else 1.0/9.81
-            
-            # Etiquetas de unidades según el tipo de datos
-            if data_type == "Aceleración":
-                unit_label = "m/s²" if display_unit == "m/s²" else "g"
-                title_prefix = "Aceleración"
-                data_field_suffix = "aceleracion"
-            elif data_type == "Velocidad":
-                unit_label = "m/s"
-                title_prefix = "Velocidad"
-                data_field_suffix = "velocidad"
-            else:  # Desplazamiento
-                unit_label = "m"
-                title_prefix = "Desplazamiento"
-                data_field_suffix = "desplazamiento"
-            
-            # Configuración común para todos los gráficos
-            graph_config = {
-                "displayModeBar": True,
-                "displaylogo": False,
-                "modeBarButtonsToRemove": ["lasso2d", "select2d"],
-                "modeBarButtonsToAdd": [
-                    "drawopenpath",
-                    "eraseshape",
-                    "zoomIn2d",
-                    "zoomOut2d",
-                    "autoScale2d"
-                ],
-                "toImageButtonOptions": {
-                    "format": "png",
-                    "filename": "grafico",
-                    "height": 800,
-                    "width": 1200,
-                    "scale": 2
-                }
-            }
-
-            # Configuración común del layout
-            layout_config = {
-                "height": 350,
-                "margin": dict(l=50, r=20, t=40, b=30),
-                "showlegend": True,
-                "legend": dict(
-                    yanchor="top",
-                    y=0.99,
-                    xanchor="right",
-                    x=0.99,
-                    bgcolor="rgba(255, 255, 255, 0.5)",
-                    bordercolor="rgba(128, 128, 128, 0.3)",
-                    borderwidth=1
-                ),
-                "xaxis": dict(
-                    range=[zoom_start, zoom_end],
-                    rangeslider=dict(visible=True, thickness=0.1),
-                    title="Tiempo (s)",
-                    gridcolor="rgba(128, 128, 128, 0.2)",
-                    showgrid=True,
-                    zeroline=True,
-                    zerolinecolor="rgba(0, 0, 0, 0.3)",
-                    zerolinewidth=1
-                ),
-                "plot_bgcolor": "rgba(0, 0, 0, 0)",
-                "paper_bgcolor": "rgba(0, 0, 0, 0)"
-            }
-
-            # Colores personalizados para cada componente
-            colors = {
-                "N": "#1f77b4",    # Azul
-                "E": "#2ca02c",   # Verde
-                "Z": "#d62728",     # Rojo
-                "vector_suma": "#9467bd"       # Morado
-            }
-
-            # Crear gráficos para cada componente con la nueva configuración
-            st.markdown("""
-                <div class='info-container'>
-                    <h3 style='margin: 0;'>Visualización de Componentes</h3>
-                    <p style='margin: 0.5rem 0 0 0;'>Gráficos detallados de cada componente del registro sísmico.</p>
-                </div>
-            """, unsafe_allow_html=True)
-
-            # Crear gráficos para cada componente disponible
-            for component in data['components']:
-                fig_comp = go.Figure()
-                fig_comp.add_trace(go.Scatter(
-                    x=data['time'],
-                    y=data[f'{component}_{data_field_suffix}'] * conversion_factor,
-                    mode='lines',
-                    name=component,
-                    line=dict(
-                        color=colors.get(component, "#1f77b4"),
-                        width=2,
-                        shape='linear'
-                    ),
-                    hovertemplate="<b>Tiempo:</b> %{x:.2f}s<br><b>Valor:</b> %{y:.3f} " + unit_label
-                ))
-                
-                # Configuración específica para el componente
-                max_val = abs(data[f'{component}_{data_field_suffix}']).max() * conversion_factor * 1.2
-                layout_comp = layout_config.copy()
-                layout_comp.update({
-                    "title": dict(
-                        text=f"<b>{title_prefix} - Componente {component}</b>",
-                        x=0.5,
-                        xanchor='center',
-                        font=dict(size=16)
-                    ),
-                    "yaxis": dict(
-                        title=dict(
-                            text=f"{title_prefix} ({unit_label})",
-                            standoff=10
-                        ),
-                        range=[-max_val, max_val],
-                        gridcolor="rgba(128, 128, 128, 0.2)",
-                        showgrid=True,
-                        zeroline=True,
-                        zerolinecolor="rgba(0, 0, 0, 0.3)",
-                        zerolinewidth=1
-                    )
-                })
-                fig_comp.update_layout(**layout_comp)
-                
-                # Agregar anotaciones para valores máximos y mínimos
-                max_idx = np.argmax(abs(data[f'{component}_{data_field_suffix}']))
-                max_time = data['time'][max_idx]
-                max_value = data[f'{component}_{data_field_suffix}'][max_idx] * conversion_factor
-                
-                fig_comp.add_annotation(
-                    x=max_time,
-                    y=max_value,
-                    text=f"Max: {max_value:.2f} {unit_label}",
-                    showarrow=True,
-                    arrowhead=2,
-                    arrowsize=1,
-                    arrowwidth=2,
-                    arrowcolor=colors.get(component, "#1f77b4"),
-                    bgcolor="rgba(0, 0, 0, 0)",
-                    bordercolor=colors.get(component, "#1f77b4"),
-                    borderwidth=1,
-                    borderpad=4,
-                    font=dict(size=10, color=colors.get(component, "#1f77b4"))
-                )
-                
-                st.plotly_chart(fig_comp, use_container_width=True, config=graph_config)
-            
-            # Vector Suma (si hay más de una componente)
-            if len(data['components']) > 1:
-                fig_suma = go.Figure()
-                fig_suma.add_trace(go.Scatter(
-                    x=data['time'],
-                    y=data[f'vector_suma_{data_field_suffix}'] * conversion_factor,
-                    mode='lines',
-                    name="Vector Suma",
-                    line=dict(
-                        color=colors["vector_suma"],
-                        width=2,
-                        shape='linear'
-                    ),
-                    hovertemplate="<b>Tiempo:</b> %{x:.2f}s<br><b>Valor:</b> %{y:.3f} " + unit_label
-                ))
-                
-                max_val_suma = data[f'vector_suma_{data_field_suffix}'].max() * conversion_factor * 1.2
-                # Encontrar el tiempo del valor máximo para la anotación
-                max_idx_suma = np.argmax(data[f'vector_suma_{data_field_suffix}'])
-                max_time_suma = data['time'][max_idx_suma]
-                max_value_suma = data[f'vector_suma_{data_field_suffix}'][max_idx_suma] * conversion_factor
-                
-                fig_suma.update_layout(
-                    title=dict(
-                        text=f"<b>Magnitud Resultante ({title_prefix})</b>",
-                        x=0.5,
-                        xanchor='center',
-                        font=dict(size=16)
-                    ),
-                    **layout_config,
-                    yaxis=dict(
-                        title=dict(
-                            text=f"{title_prefix} ({unit_label})",
-                            standoff=10
-                        ),
-                        range=[0, max_val_suma],
-                        gridcolor="rgba(128, 128, 128, 0.2)",
-                        showgrid=True,
-                        zeroline=True,
-                        zerolinecolor="rgba(0, 0, 0, 0.3)",
-                        zerolinewidth=1
-                    )
-                )
-                
-                # Agregar anotación para el valor máximo
-                fig_suma.add_annotation(
-                    x=max_time_suma,
-                    y=max_value_suma,
-                    text=f"Max: {max_value_suma:.2f} {unit_label}",
-                    showarrow=True,
-                    arrowhead=2,
-                    arrowsize=1,
-                    arrowwidth=2,
-                    arrowcolor=colors["vector_suma"],
-                    bgcolor="rgba(0, 0, 0, 0)",
-                    bordercolor=colors["vector_suma"],
-                    borderwidth=1,
-                    borderpad=4,
-                    font=dict(size=10, color=colors["vector_suma"])
-                )
-                
-                st.plotly_chart(fig_suma, use_container_width=True, config=graph_config)
-            
-            # Opciones adicionales para análisis
-            st.subheader("Opciones adicionales para análisis")
-            
-            # Selector de componentes para el gráfico individual
-            available_components = data['components'] + ['vector_suma'] if len(data['components']) > 1 else data['components']
-            components = st.multiselect(
-                "Seleccionar componentes para visualizar juntos:",
-                available_components,
-                default=data['components'],
-                key="components_tab1"
-            )
-            
-            # Crear gráfico individual con todos los componentes seleccionados
-            if components:
-                fig1 = go.Figure()
-                for component in components:
-                    fig1.add_trace(go.Scatter(
-                        x=data['time'],
-                        y=data[f'{component}_{data_field_suffix}'] * conversion_factor,
-                        mode='lines',
-                        name=component,
-                        line=dict(color=colors.get(component, "#1f77b4"))
-                    ))
-        
-                # Calcular el rango del eje Y basado en el máximo valor absoluto
-                max_vals = []
-                for component in components:
-                    if component != 'vector_suma':
-                        max_vals.append(abs(data[f'{component}_{data_field_suffix}']).max() * conversion_factor)
-                    else:
-                        max_vals.append(data[f'{component}_{data_field_suffix}'].max() * conversion_factor)
-                        
-                y_max = max(max_vals) * 1.2  # Ampliar el valor máximo para el rango
-
-                # Configuración del gráfico individual
-                fig1.update_layout(
-                    title=dict(
-                        text=f"<b>Registro de {title_prefix} - {data['name']}</b>",
-                        x=0.5,
-                        xanchor='center',
-                        font=dict(size=16)
-                    ),
-                    xaxis=dict(
-                        rangeslider=dict(visible=True, thickness=0.1),
-                        type="linear",
-                        range=[zoom_start, zoom_end],
-                        title="Tiempo (s)",
-                        gridcolor="rgba(128, 128, 128, 0.2)",
-                        showgrid=True,
-                        zeroline=True,
-                        zerolinecolor="rgba(0, 0, 0, 0.3)",
-                        zerolinewidth=1
-                    ),
-                    yaxis=dict(
-                        title=dict(
-                            text=f"{title_prefix} ({unit_label})",
-                            standoff=10
-                        ),
-                        exponentformat='e',
-                        showexponent='all',
-                        tickformat='.2e',
-                        range=[-y_max, y_max],  # Rango simétrico
-                        gridcolor="rgba(128, 128, 128, 0.2)",
-                        showgrid=True,
-                        zeroline=True,
-                        zerolinecolor="rgba(0, 0, 0, 0.3)",
-                        zerolinewidth=1
-                    ),
-                    showlegend=True,
-                    legend=dict(
-                        yanchor="top",
-                        y=0.99,
-                        xanchor="right",
-                        x=0.99,
-                        bgcolor="rgba(255, 255, 255, 0.5)",
-                        bordercolor="rgba(128, 128, 128, 0.3)",
-                        borderwidth=1
-                    ),
-                    height=600,
-                    margin=dict(l=50, r=20, t=40, b=30),
-                    plot_bgcolor="rgba(0, 0, 0, 0)",
-                    paper_bgcolor="rgba(0, 0, 0, 0)"
-                )
-                
-                st.plotly_chart(fig1, use_container_width=True, config=graph_config)
-                
-            # Estadísticas básicas
-            with st.expander("Estadísticas", expanded=True):
-                stats_data = []
-                for component in data['components']:
-                    y_data = data[f'{component}_{data_field_suffix}']
-                    stats = {
-                        "Componente": component,
-                        "Valor Máximo": np.max(np.abs(y_data)),
-                        "Valor Mínimo": np.min(y_data),
-                        "Media": np.mean(y_data),
-                        "Desviación Estándar": np.std(y_data),
-                        "RMS": np.sqrt(np.mean(np.square(y_data)))
-                    }
-                    stats_data.append(stats)
-                    
-                if len(data['components']) > 1:
-                    y_data = data[f'vector_suma_{data_field_suffix}']
-                    stats = {
-                        "Componente": "Vector Suma",
-                        "Valor Máximo": np.max(y_data),
-                        "Valor Mínimo": np.min(y_data),
-                        "Media": np.mean(y_data),
-                        "Desviación Estándar": np.std(y_data),
-                        "RMS": np.sqrt(np.mean(np.square(y_data)))
-                    }
-                    stats_data.append(stats)
-                
-                stats_df = pd.DataFrame(stats_data)
-                st.dataframe(stats_df, use_container_width=True)
+            _render_individual_view(all_data)
         
         with tab8:
-            st.markdown("""
-                <div class='info-container'>
-                    <h2>Reportes Automáticos</h2>
-                    <p>Genera reportes automáticos con los resultados del análisis.</p>
-                </div>
-            """, unsafe_allow_html=True)
-            
-            # Selector de registro
-            selected_data_index = st.selectbox(
-                "Seleccionar registro para el reporte", 
-                range(len(all_data)), 
-                format_func=lambda i: all_data[i]['name'],
-                key="report_data_selector"
-            )
-            data = all_data[selected_data_index]
-            
-            # Opciones del reporte
-            st.subheader("Opciones del Reporte")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                include_metadata = st.checkbox("Incluir metadatos", value=True)
-                include_time_series = st.checkbox("Incluir series de tiempo", value=True)
-                include_fft = st.checkbox("Incluir análisis espectral", value=True)
-            
-            with col2:
-                include_response_spectrum = st.checkbox("Incluir espectro de respuesta", value=True)
-                include_stats = st.checkbox("Incluir estadísticas", value=True)
-                include_events = st.checkbox("Incluir detección de eventos", value=False)
-            
-            # Formato del reporte
-            report_format = st.selectbox(
-                "Formato del reporte",
-                ["PDF", "HTML", "DOCX"],
-                index=0
-            )
-            
-            # Botón para generar reporte
-            if st.button("Generar Reporte"):
-                with st.spinner("Generando reporte..."):
-                    try:
-                        # Calcular resultados de análisis necesarios para el reporte
-                        analysis_results = {}
-                        
-                        # Calcular FFT si se solicita
-                        if include_fft:
-                            analysis_results['fft'] = {}
-                            for component in data['components']:
-                                # Calcular FFT
-                                signal = data[f'{component}_aceleracion']
-                                N = len(signal)
-                                T = data['time'][1] - data['time'][0]  # Intervalo de tiempo
-                                
-                                yf = fft(signal)
-                                xf = fftfreq(N, T)[:N//2]
-                                
-                                # Solo usar la mitad positiva del espectro
-                                analysis_results['fft'][component] = {
-                                    'frequencies': xf,
-                                    'amplitudes': 2.0/N * np.abs(yf[:N//2])
-                                }
-                        
-                        # Calcular espectro de respuesta si se solicita
-                        if include_response_spectrum:
-                            analysis_results['response_spectrum'] = {}
-                            
-                            # Definir periodos para el espectro de respuesta
-                            periods = np.logspace(-1, 1, 100)  # De 0.1 a 10 segundos
-                            
-                            # Calcular para cada componente
-                            for component in data['components']:
-                                signal_processor = SignalProcessor(float(data['metadata'].get('sampling_rate', 100)))
-                                spectrum = signal_processor.compute_response_spectrum(
-                                    data[f'{component}_aceleracion'],
-                                    data['time'],
-                                    periods=periods
-                                )
-                                analysis_results['response_spectrum'][component] = spectrum
-                        
-                        # Generar el reporte
-                        report_generator = ReportGenerator()
-                        report_file = report_generator.generate_report(
-                            data, 
-                            analysis_results,
-                            output_format=report_format.lower(),
-                            options={
-                                'include_metadata': include_metadata,
-                                'include_time_series': include_time_series,
-                                'include_fft': include_fft,
-                                'include_response_spectrum': include_response_spectrum,
-                                'include_stats': include_stats,
-                                'include_events': include_events
-                            }
-                        )
-                        
-                        # Preparar descarga
-                        with open(report_file, "rb") as file:
-                            file_bytes = file.read()
-                            b64 = base64.b64encode(file_bytes).decode()
-                            
-                            extension = report_format.lower()
-                            mime_type = {
-                                'pdf': 'application/pdf',
-                                'html': 'text/html',
-                                'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-                            }[extension]
-                            
-                            file_name = f"reporte_{data['name'].split('.')[0]}.{extension}"
-                            
-                            href = f'<a href="data:{mime_type};base64,{b64}" download="{file_name}">Descargar Reporte {report_format}</a>'
-                            st.markdown(href, unsafe_allow_html=True)
-                            
-                            st.success(f"Reporte generado correctamente en formato {report_format}")
-                    
-                    except Exception as e:
-                        st.error(f"Error al generar el reporte: {str(e)}")
+            _render_reports(all_data)
 
     except Exception as e:
         st.error(f"Error al procesar los archivos: {str(e)}")
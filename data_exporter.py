@@ -2,8 +2,39 @@ import pandas as pd
 import json
 import plotly
 import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 from pathlib import Path
 
+# Filas que se convierten a texto de una vez al exportar CSV: la memoria
+# usada depende del bloque y no de la longitud del registro
+CSV_BLOCK_ROWS = 65536
+
+def _csv_column(values):
+    """
+    Convierte una columna a texto tal como la escribe DataFrame.to_csv
+    
+    Cada valor se escribe con la representación más corta que lo recupera
+    exactamente (repr en float64, la de NumPy en float32), y los NaN como
+    celdas vacías.
+    
+    Args:
+        values (numpy.array): Valores de la columna
+        
+    Returns:
+        list: Texto de cada valor
+    """
+    if values.dtype == np.float64:
+        text = list(map(repr, values.tolist()))
+    else:
+        text = values.astype(str).tolist()
+    if values.dtype.kind == 'f':
+        for i in np.flatnonzero(np.isnan(values)).tolist():
+            text[i] = ''
+    return text
+
+
 class DataExporter:
     def __init__(self, output_dir="exports"):
         """
@@ -20,23 +51,43 @@ class DataExporter:
         Args:
             data: Diccionario con los datos del registro
             filename: Nombre base del archivo
-            format: Formato de exportación ('csv', 'excel', 'json')
+            format: Formato de exportación ('csv', 'excel', 'json', 'parquet', 'feather')
         Returns:
             path: Ruta del archivo guardado
         """
-        # Crear DataFrame
-        df = pd.DataFrame({
-            'time': data['time'],
-            'E': data['E'],
-            'N': data['N'],
-            'Z': data['Z']
-        })
+        columns = ['time', 'E', 'N', 'Z']
         
-        # Exportar según formato
+        # CSV: se escribe por bloques de filas, sin construir un DataFrame, con
+        # el mismo texto que DataFrame.to_csv (ver _csv_column)
         if format == 'csv':
             output_path = self.output_dir / f"{filename}.csv"
-            df.to_csv(output_path, index=False)
-        elif format == 'excel':
+            arrays = [np.asarray(data[column]) for column in columns]
+            n_rows = min(len(array) for array in arrays)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(','.join(columns) + '\n')
+                for start in range(0, n_rows, CSV_BLOCK_ROWS):
+                    block = slice(start, min(start + CSV_BLOCK_ROWS, n_rows))
+                    text_columns = [_csv_column(array[block]) for array in arrays]
+                    f.writelines(','.join(row) + '\n' for row in zip(*text_columns))
+            return output_path
+        
+        # Parquet y Feather (Arrow IPC): columnas binarias construidas sobre
+        # los mismos buffers de NumPy, sin pasar por pandas ni por texto
+        if format in ('parquet', 'feather'):
+            table = pa.table({column: np.asarray(data[column]) for column in columns})
+            if format == 'parquet':
+                output_path = self.output_dir / f"{filename}.parquet"
+                pq.write_table(table, output_path, compression='zstd')
+            else:
+                output_path = self.output_dir / f"{filename}.feather"
+                feather.write_feather(table, output_path)
+            return output_path
+        
+        # Crear DataFrame
+        df = pd.DataFrame({column: data[column] for column in columns})
+        
+        # Exportar según formato
+        if format == 'excel':
             output_path = self.output_dir / f"{filename}.xlsx"
             df.to_excel(output_path, index=False)
         elif format == 'json':
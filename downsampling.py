@@ -0,0 +1,81 @@
+"""
+Reducción de muestras para visualización.
+Permite enviar al navegador series largas con un número de puntos acorde
+a la resolución de la pantalla, conservando la forma visual de la señal.
+"""
+
+import numpy as np
+from fast_kernels import NUMBA_AVAILABLE, lttb_indices
+
+# Verificar si tsdownsample está disponible (LTTB compilado, con SIMD)
+try:
+    from tsdownsample import LTTBDownsampler
+    TSDOWNSAMPLE_AVAILABLE = True
+except ImportError:
+    TSDOWNSAMPLE_AVAILABLE = False
+
+
+def lttb(x, y, n_out=2000):
+    """
+    Reduce una serie con el algoritmo Largest-Triangle-Three-Buckets (LTTB)
+
+    Se conservan el primer y el último punto; del resto se elige, en cada
+    segmento, la muestra que forma el triángulo de mayor área con la muestra
+    elegida en el segmento anterior y el promedio del segmento siguiente.
+    Así se preservan los picos, que son lo relevante en un acelerograma.
+    Si tsdownsample está instalado se usa su implementación compilada; si
+    no, el núcleo de Numba de fast_kernels o, en su defecto, NumPy.
+
+    Args:
+        x (numpy.array): Valores del eje X (p. ej. tiempo), crecientes
+        y (numpy.array): Valores del eje Y
+        n_out (int): Número de puntos de salida
+
+    Returns:
+        tuple: Arrays (x, y) reducidos
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(x)
+
+    if n_out >= n or n_out < 3:
+        return x, y
+    
+    if TSDOWNSAMPLE_AVAILABLE:
+        indices = LTTBDownsampler().downsample(
+            np.ascontiguousarray(x), np.ascontiguousarray(y), n_out=n_out
+        )
+        return x[indices], y[indices]
+
+    # Límites de los n_out - 2 segmentos interiores
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    
+    if NUMBA_AVAILABLE:
+        indices = lttb_indices(x, y, edges)
+        return x[indices], y[indices]
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # Promedio del segmento siguiente (el último punto para el segmento final)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Área (sin el factor 1/2) del triángulo para cada candidato del segmento
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+
+    return x[indices], y[indices]
@@ -1,5 +1,6 @@
 import numpy as np
 from scipy import signal
+from fast_kernels import NUMBA_AVAILABLE, max_abs, peaks_above, window_features
 
 class EventDetector:
     def __init__(self, sampling_rate):
@@ -91,11 +92,15 @@ class EventDetector:
         abs_data = np.abs(np.real(data))
         
         # Detectar picos que superan el umbral
-        peaks, properties = signal.find_peaks(
-            abs_data,
-            height=threshold,
-            distance=distance
-        )
+        if NUMBA_AVAILABLE:
+            peaks, heights = peaks_above(abs_data, threshold, distance)
+            properties = {'peak_heights': heights}
+        else:
+            peaks, properties = signal.find_peaks(
+                abs_data,
+                height=threshold,
+                distance=distance
+            )
         
         # Asegurar que se encontraron picos
         if len(peaks) == 0:
@@ -122,13 +127,72 @@ class EventDetector:
         end = min(len(data), event_idx + window_samples//2)
         event_data = data[start:end]
         
+        # La energía (suma de cuadrados) se calcula una vez y de ella se obtiene
+        # el RMS, sin crear el array de cuadrados
+        energy = np.dot(event_data, event_data)
+        
         # Calcular características
         features = {
-            'peak_amplitude': np.max(np.abs(event_data)),
-            'rms': np.sqrt(np.mean(event_data**2)),
+            'peak_amplitude': max_abs(event_data),
+            'rms': np.sqrt(energy / len(event_data)),
             'duration': len(event_data) / self.sampling_rate,
-            'energy': np.sum(event_data**2),
-            'zero_crossings': len(np.where(np.diff(np.signbit(event_data)))[0])
+            'energy': energy,
+            'zero_crossings': int(np.count_nonzero(np.diff(np.signbit(event_data))))
         }
         
         return features
+    
+    def calculate_event_features_batch(self, data, event_times, window=5.0):
+        """
+        Calcula las características de varios eventos a la vez
+        
+        Equivale a llamar a calculate_event_features por cada evento, pero
+        con un núcleo de Numba que recorre sólo las ventanas o, sin Numba,
+        con reducciones vectorizadas sobre todos los segmentos (reduceat) en
+        lugar de un bucle de Python.
+        
+        Args:
+            data: Array de datos
+            event_times: Tiempos de los eventos en segundos
+            window: Ventana de análisis en segundos
+        Returns:
+            features: Diccionario con un array por característica (un valor por evento)
+        """
+        data = np.asarray(data)
+        n = len(data)
+        event_idx = (np.asarray(event_times, dtype=np.float64) * self.sampling_rate).astype(np.int64)
+        half = int(window * self.sampling_rate) // 2
+        
+        # Límites [start, end) de cada ventana, igual que en el cálculo individual
+        start = np.clip(event_idx - half, 0, None)
+        end = np.minimum(n, event_idx + half)
+        lengths = end - start
+        
+        if NUMBA_AVAILABLE:
+            peak_amplitude, energy, zero_crossings = window_features(data, start, end)
+        else:
+            # reduceat sobre los índices intercalados (start0, end0, start1, ...)
+            # reduce cada segmento [start, end); se añade una muestra al final
+            # para que end = n sea un índice válido
+            bounds = np.column_stack([start, end]).ravel()
+            buffer = np.empty(n + 1, dtype=np.float64)
+            buffer[n] = 0.0
+            
+            np.abs(data, out=buffer[:n])
+            peak_amplitude = np.maximum.reduceat(buffer, bounds)[::2]
+            
+            np.square(data, out=buffer[:n])
+            energy = np.add.reduceat(buffer, bounds)[::2]
+            
+            # Cruces por cero: cambios de signo entre muestras consecutivas,
+            # contados por segmento con su suma acumulada
+            crossings = np.concatenate(([0], np.cumsum(np.diff(np.signbit(data)))))
+            zero_crossings = crossings[np.maximum(end - 1, start)] - crossings[start]
+        
+        return {
+            'peak_amplitude': peak_amplitude,
+            'rms': np.sqrt(energy / lengths),
+            'duration': lengths / self.sampling_rate,
+            'energy': energy,
+            'zero_crossings': zero_crossings
+        }
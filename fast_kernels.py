@@ -0,0 +1,383 @@
+"""
+Núcleos numéricos para las operaciones más costosas sobre las señales.
+Usa Numba cuando está instalado y recurre a NumPy en caso contrario.
+"""
+
+import math
+
+import numpy as np
+
+# Verificar si numba está disponible
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _cumulative_trapezoid_kernel(y, dt, out):
+        out[0] = 0.0
+        acc = 0.0
+        for i in range(1, y.shape[0]):
+            acc += 0.5 * (y[i] + y[i - 1]) * dt
+            out[i] = acc
+        return out
+
+    @njit(cache=True)
+    def _magnitude_peaks_kernel(arrays, out, peak_idx):
+        # Magnitud y |valor| máximo de cada componente en una sola pasada
+        n_comp = len(arrays)
+        best = np.full(n_comp + 1, -1.0)
+        for i in range(out.shape[0]):
+            ss = 0.0
+            for c in range(n_comp):
+                v = np.float64(arrays[c][i])
+                ss += v * v
+                av = abs(v)
+                if av > best[c]:
+                    best[c] = av
+                    peak_idx[c] = i
+            m = math.sqrt(ss)
+            out[i] = m
+            if m > best[n_comp]:
+                best[n_comp] = m
+                peak_idx[n_comp] = i
+        return out
+
+    @njit(cache=True)
+    def _lttb_kernel(x, y, edges, indices):
+        # Mismo recorrido que downsampling.lttb, compilado
+        n = x.shape[0]
+        n_edges = edges.shape[0]
+        a = 0
+        for i in range(n_edges - 1):
+            start = edges[i]
+            end = edges[i + 1]
+            if i + 2 < n_edges:
+                next_start = edges[i + 1]
+                next_end = edges[i + 2]
+            else:
+                next_start = n - 1
+                next_end = n
+            avg_x = 0.0
+            avg_y = 0.0
+            for k in range(next_start, next_end):
+                avg_x += x[k]
+                avg_y += y[k]
+            avg_x /= next_end - next_start
+            avg_y /= next_end - next_start
+
+            best = -1.0
+            best_k = start
+            for k in range(start, end):
+                area = abs((x[a] - avg_x) * (y[k] - y[a]) - (x[a] - x[k]) * (avg_y - y[a]))
+                if area > best:
+                    best = area
+                    best_k = k
+            a = best_k
+            indices[i + 1] = a
+        return indices
+
+    @njit(cache=True)
+    def _peaks_above_kernel(x, threshold, out):
+        # Máximos locales (mismo criterio que scipy.signal.find_peaks, con
+        # mesetas) descartando en la misma pasada los que no llegan al umbral
+        m = 0
+        i = 1
+        i_max = x.shape[0] - 1
+        while i < i_max:
+            if x[i] >= threshold and x[i - 1] < x[i]:
+                i_ahead = i + 1
+                while i_ahead < i_max and x[i_ahead] == x[i]:
+                    i_ahead += 1
+                if x[i_ahead] < x[i]:
+                    out[m] = (i + i_ahead - 1) // 2
+                    m += 1
+                    i = i_ahead
+            i += 1
+        return out[:m]
+
+    @njit(cache=True)
+    def _select_by_distance_kernel(peaks, order, distance, keep):
+        # De mayor a menor altura, cada pico conservado suprime a sus vecinos
+        n = peaks.shape[0]
+        for i in range(n - 1, -1, -1):
+            j = order[i]
+            if not keep[j]:
+                continue
+            k = j - 1
+            while k >= 0 and peaks[j] - peaks[k] < distance:
+                keep[k] = False
+                k -= 1
+            k = j + 1
+            while k < n and peaks[k] - peaks[j] < distance:
+                keep[k] = False
+                k += 1
+        return keep
+
+    @njit(cache=True)
+    def _window_features_kernel(data, start, end, peak, energy, crossings):
+        # Pico, energía y cruces por cero de cada ventana en una sola pasada,
+        # recorriendo sólo las muestras de las ventanas
+        for i in range(start.shape[0]):
+            p = 0.0
+            e = 0.0
+            c = 0
+            prev_neg = math.copysign(1.0, data[start[i]]) < 0 if end[i] > start[i] else False
+            for j in range(start[i], end[i]):
+                v = np.float64(data[j])
+                av = abs(v)
+                if av > p:
+                    p = av
+                e += v * v
+                neg = math.copysign(1.0, v) < 0
+                if neg != prev_neg:
+                    c += 1
+                prev_neg = neg
+            peak[i] = p
+            energy[i] = e
+            crossings[i] = c
+
+    @njit(fastmath=True, cache=True)
+    def _reduce4_kernel(y):
+        # Suma, suma de cuadrados, mínimo y máximo en una sola pasada
+        s = 0.0
+        ss = 0.0
+        mn = np.float64(y[0])
+        mx = np.float64(y[0])
+        for i in range(y.shape[0]):
+            v = np.float64(y[i])
+            s += v
+            ss += v * v
+            mn = min(mn, v)
+            mx = max(mx, v)
+        return s, ss, mn, mx
+
+
+def abs_argmax(a):
+    """
+    Busca la muestra de mayor valor absoluto de una señal
+
+    Como max_abs, usa las reducciones argmax y argmin de NumPy (vectorizadas
+    con SIMD) en lugar de un bucle de Numba o de crear el array |a|. Elige la
+    misma muestra que np.argmax(np.abs(a)): ante un empate, la primera.
+
+    Args:
+        a (numpy.array): Señal de entrada (no vacía)
+
+    Returns:
+        tuple: Índice de la muestra y su valor (con signo)
+    """
+    a = np.asarray(a)
+    idx_max = int(a.argmax())
+    idx_min = int(a.argmin())
+    high = a[idx_max]
+    low = -a[idx_min]
+    if high > low:
+        idx = idx_max
+    elif low > high:
+        idx = idx_min
+    else:
+        idx = min(idx_max, idx_min)
+    return idx, a[idx]
+
+
+def max_abs(a):
+    """
+    Calcula el máximo valor absoluto de una señal sin crear el array |a|
+    
+    Usa las reducciones max y min de NumPy (vectorizadas con SIMD), más
+    rápidas que un bucle de Numba para esta operación.
+    
+    Args:
+        a (numpy.array): Señal de entrada (no vacía)
+        
+    Returns:
+        float: Máximo de |a|
+    """
+    a = np.asarray(a)
+    return float(max(a.max(), -a.min()))
+
+
+def magnitude_and_peaks(arrays):
+    """
+    Calcula la magnitud de varias componentes y la muestra pico de cada serie
+    
+    La magnitud es la raíz de la suma de cuadrados muestra a muestra (el
+    vector suma). Con Numba, la magnitud y los picos absolutos de las
+    componentes y de la magnitud salen de una sola pasada, acumulando en
+    float64; sin Numba, la suma de cuadrados se acumula en su lugar con un
+    único buffer auxiliar y los picos se buscan con abs_argmax.
+    
+    Args:
+        arrays (list): Componentes de igual longitud (numpy.array)
+        
+    Returns:
+        tuple: Magnitud (numpy.array) y lista de picos (índice, valor con
+            signo), uno por componente y el último de la magnitud
+    """
+    dtype = np.result_type(*arrays)
+    arrays = tuple(np.ascontiguousarray(a, dtype=dtype) for a in arrays)
+    
+    if NUMBA_AVAILABLE:
+        magnitude = np.empty(len(arrays[0]), dtype=dtype)
+        peak_idx = np.zeros(len(arrays) + 1, dtype=np.int64)
+        _magnitude_peaks_kernel(arrays, magnitude, peak_idx)
+        peaks = [
+            (int(idx), values[idx])
+            for idx, values in zip(peak_idx, arrays + (magnitude,))
+        ]
+        return magnitude, peaks
+    
+    magnitude = np.multiply(arrays[0], arrays[0])
+    tmp = np.empty_like(magnitude)
+    for values in arrays[1:]:
+        np.multiply(values, values, out=tmp)
+        magnitude += tmp
+    np.sqrt(magnitude, out=magnitude)
+    peaks = [abs_argmax(values) for values in arrays + (magnitude,)]
+    return magnitude, peaks
+
+
+def lttb_indices(x, y, edges):
+    """
+    Elige las muestras de LTTB con el núcleo compilado de Numba
+    
+    Requiere Numba (ver NUMBA_AVAILABLE); downsampling.lttb lo usa cuando
+    está disponible.
+    
+    Args:
+        x (numpy.array): Valores del eje X, crecientes
+        y (numpy.array): Valores del eje Y
+        edges (numpy.array): Límites de los segmentos interiores (int64)
+        
+    Returns:
+        numpy.array: Índices de las muestras elegidas, con el primero y el último
+    """
+    indices = np.empty(len(edges) + 1, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = len(x) - 1
+    return _lttb_kernel(x, y, edges, indices)
+
+
+def peaks_above(x, threshold, distance=1):
+    """
+    Detecta picos que superan un umbral con el núcleo compilado de Numba
+    
+    Equivale a scipy.signal.find_peaks(x, height=threshold, distance=distance).
+    El costo sigue siendo O(N), porque se recorren todas las muestras, pero
+    con una constante menor: el umbral se aplica durante la misma pasada que
+    busca los máximos locales, sin las pasadas y arrays intermedios de
+    find_peaks, y la selección por distancia solo ordena los picos que lo
+    superan. Requiere Numba (ver NUMBA_AVAILABLE).
+    
+    Args:
+        x (numpy.array): Señal de entrada (p. ej. |a|)
+        threshold (float): Altura mínima de los picos
+        distance (int): Distancia mínima entre picos en muestras
+        
+    Returns:
+        tuple: Índices de los picos y sus alturas
+    """
+    x = np.ascontiguousarray(x)
+    peaks = _peaks_above_kernel(x, threshold, np.empty(len(x) // 2 + 1, dtype=np.int64))
+    heights = x[peaks]
+    
+    if distance > 1 and len(peaks) > 1:
+        # El mismo orden por altura que find_peaks, para desempatar igual
+        keep = _select_by_distance_kernel(
+            peaks, np.argsort(heights), int(np.ceil(distance)),
+            np.ones(len(peaks), dtype=np.bool_)
+        )
+        peaks = peaks[keep]
+        heights = heights[keep]
+    
+    return peaks, heights
+
+
+def window_features(data, start, end):
+    """
+    Calcula pico absoluto, energía y cruces por cero de varias ventanas
+    
+    Requiere Numba (ver NUMBA_AVAILABLE); sólo recorre las muestras dentro de
+    las ventanas [start, end), en lugar de la señal completa.
+    
+    Args:
+        data (numpy.array): Señal de entrada
+        start (numpy.array): Inicio de cada ventana (int64)
+        end (numpy.array): Fin de cada ventana, exclusivo (int64)
+        
+    Returns:
+        tuple: Arrays de pico absoluto, energía y cruces por cero por ventana
+    """
+    m = len(start)
+    peak = np.empty(m, dtype=np.float64)
+    energy = np.empty(m, dtype=np.float64)
+    crossings = np.empty(m, dtype=np.int64)
+    _window_features_kernel(np.ascontiguousarray(data), start, end, peak, energy, crossings)
+    return peak, energy, crossings
+
+
+def cumulative_trapezoid(y, dt):
+    """
+    Integra una señal con la regla trapezoidal acumulada
+
+    Equivale a y(n) = y(n-1) + (x(n) + x(n-1))*dt/2 con valor inicial cero.
+
+    Args:
+        y (numpy.array): Señal a integrar
+        dt (float): Intervalo de muestreo en segundos
+
+    Returns:
+        numpy.array: Integral acumulada, del mismo tamaño que la entrada
+    """
+    y = np.asarray(y)
+    out = np.empty_like(y, dtype=np.result_type(y.dtype, np.float32))
+    if len(y) == 0:
+        return out
+
+    if NUMBA_AVAILABLE:
+        return _cumulative_trapezoid_kernel(y, float(dt), out)
+
+    out[0] = 0.0
+    np.cumsum((y[1:] + y[:-1]) * (dt / 2), out=out[1:])
+    return out
+
+
+def summary_stats(y):
+    """
+    Calcula las estadísticas básicas de una señal en una sola pasada
+
+    La media, la desviación estándar y el RMS se derivan de la suma y la
+    suma de cuadrados, acumuladas en float64.
+
+    Args:
+        y (numpy.array): Señal de entrada (no vacía)
+
+    Returns:
+        dict: Valores 'min', 'max', 'mean', 'std' y 'rms' de la señal
+    """
+    y = np.asarray(y)
+    n = len(y)
+
+    if NUMBA_AVAILABLE:
+        s, ss, mn, mx = _reduce4_kernel(y)
+    else:
+        y64 = y.astype(np.float64, copy=False)
+        s = y64.sum()
+        ss = np.dot(y64, y64)
+        mn = y64.min()
+        mx = y64.max()
+
+    mean = s / n
+    # La varianza por momentos puede quedar levemente negativa por redondeo
+    var = max(ss / n - mean * mean, 0.0)
+    return {
+        'min': float(mn),
+        'max': float(mx),
+        'mean': float(mean),
+        'std': float(np.sqrt(var)),
+        'rms': float(np.sqrt(ss / n))
+    }
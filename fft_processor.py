@@ -29,25 +29,13 @@ class FFTProcessor:
             nperseg = len(data)
             num_segments = 1
             
-        # Inicializar arrays para promediar
-        fft_avg = np.zeros(nperseg//2 + 1, dtype=complex)
+        # Segmentos consecutivos como filas de una matriz (vista, sin copia)
+        segments = np.asarray(data)[:num_segments * nperseg].reshape(num_segments, nperseg)
         
-        # Procesar cada segmento
-        for i in range(num_segments):
-            start = i * nperseg
-            end = start + nperseg
-            segment = data[start:end]
-            
-            # Aplicar ventana
-            win = getattr(signal.windows, window)(nperseg)
-            windowed_data = segment * win
-            
-            # Calcular FFT del segmento
-            fft_result = np.fft.rfft(windowed_data)
-            fft_avg += fft_result
-            
-        # Promediar resultados
-        fft_avg /= num_segments
+        # La FFT es lineal: el promedio de las FFT de los segmentos es la FFT
+        # del segmento promedio, de modo que basta una sola transformada
+        win = getattr(signal.windows, window)(nperseg)
+        fft_avg = np.fft.rfft(segments.mean(axis=0) * win)
         
         # Calcular frecuencias
         frequencies = np.fft.rfftfreq(nperseg, d=1/self.sampling_rate)
@@ -64,7 +52,7 @@ class FFTProcessor:
         """
         fig = go.Figure()
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=frequencies,
             y=magnitudes,
             mode='lines',
@@ -1,6 +1,28 @@
+import functools
 import numpy as np
 from scipy import signal
 
+
+@functools.lru_cache(maxsize=64)
+def _butter_sos(order, normal_cutoff, btype):
+    """
+    Diseña un filtro Butterworth en secciones de segundo orden (en caché)
+    
+    El diseño depende solo de los parámetros, no de los datos: se reutiliza
+    entre componentes, registros y reruns con la misma configuración.
+    
+    Args:
+        order: Orden del filtro
+        normal_cutoff: Frecuencia de corte normalizada (float, o tupla para pasa banda)
+        btype: Tipo de filtro ('low', 'high', 'band')
+    Returns:
+        sos: Coeficientes del filtro (compartidos, no modificar)
+    """
+    # No se marca de solo lectura: sosfiltfilt exige un buffer escribible
+    # (no lo modifica)
+    return signal.butter(order, normal_cutoff, btype=btype, analog=False, output='sos')
+
+
 class SignalFilter:
     def __init__(self, sampling_rate):
         """
@@ -54,40 +76,49 @@ class SignalFilter:
         b, a = signal.butter(order, [low, high], btype='band', analog=False)
         return b, a
 
-    def apply_filter(self, data, filter_type='lowpass', **kwargs):
+    def butter_sos(self, filter_type='lowpass', **kwargs):
         """
-        Aplica el filtro seleccionado a los datos
+        Obtiene el filtro seleccionado en secciones de segundo orden
         Args:
-            data: Array de datos a filtrar
             filter_type: Tipo de filtro ('lowpass', 'highpass', 'bandpass')
             **kwargs: Argumentos específicos del filtro (cutoff, order, etc.)
         Returns:
-            filtered_data: Datos filtrados
+            sos: Coeficientes del filtro
         """
-        # Eliminar tendencia lineal
-        detrended = signal.detrend(data)
+        nyq = 0.5 * self.fs
+        order = kwargs.get('order', 4)
         
-        # Aplicar el filtro seleccionado
         if filter_type == 'lowpass':
-            cutoff = kwargs.get('cutoff', 10.0)
-            order = kwargs.get('order', 4)
-            b, a = self.butter_lowpass(cutoff, order)
-            
+            return _butter_sos(order, kwargs.get('cutoff', 10.0) / nyq, 'low')
         elif filter_type == 'highpass':
-            cutoff = kwargs.get('cutoff', 0.1)
-            order = kwargs.get('order', 4)
-            b, a = self.butter_highpass(cutoff, order)
-            
+            return _butter_sos(order, kwargs.get('cutoff', 0.1) / nyq, 'high')
         elif filter_type == 'bandpass':
-            lowcut = kwargs.get('lowcut', 0.1)
-            highcut = kwargs.get('highcut', 10.0)
-            order = kwargs.get('order', 4)
-            b, a = self.butter_bandpass(lowcut, highcut, order)
+            low = kwargs.get('lowcut', 0.1) / nyq
+            high = kwargs.get('highcut', 10.0) / nyq
+            return _butter_sos(order, (low, high), 'band')
         else:
             raise ValueError(f"Tipo de filtro no soportado: {filter_type}")
 
-        # Aplicar filtro con fase cero (forward-backward)
-        filtered_data = signal.filtfilt(b, a, detrended)
+    def apply_filter(self, data, filter_type='lowpass', **kwargs):
+        """
+        Aplica el filtro seleccionado a los datos
+        Args:
+            data: Array de datos a filtrar
+            filter_type: Tipo de filtro ('lowpass', 'highpass', 'bandpass')
+            **kwargs: Argumentos específicos del filtro (cutoff, order, etc.)
+        Returns:
+            filtered_data: Datos filtrados
+        """
+        # Diseño del filtro seleccionado (en caché por parámetros)
+        sos = self.butter_sos(filter_type, **kwargs)
+        
+        # Eliminar tendencia lineal
+        detrended = signal.detrend(data)
+
+        # Aplicar filtro con fase cero (forward-backward). Las secciones de
+        # segundo orden son estables con cortes muy bajos (p. ej. 0.05 Hz),
+        # donde la forma (b, a) pierde precisión
+        filtered_data = signal.sosfiltfilt(sos, detrended)
         
         return filtered_data
 
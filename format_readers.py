@@ -11,6 +11,24 @@ from pathlib import Path
 from datetime import datetime
 import warnings
 
+def parse_ss_metadata(content):
+    """
+    Interpreta el contenido de un archivo de configuración .ss
+    
+    Cada línea con '=' aporta una clave y un valor, sin las comillas de los
+    extremos; las líneas sin '=' se ignoran.
+    
+    Args:
+        content (str): Texto del archivo .ss
+        
+    Returns:
+        dict: Metadatos leídos (valores como texto)
+    """
+    # Un único recorrido de las líneas; partition separa en el primer '='
+    lines = (line.partition('=') for line in content.split('\n'))
+    return {key.strip('"'): value.strip('"') for key, sep, value in lines if sep}
+
+
 class BaseReader:
     """Clase base para todos los lectores de formatos"""
     
@@ -760,11 +778,7 @@ class MSReader(BaseReader):
         metadata = {}
         try:
             with open(ss_file_path, 'r') as f:
-                content = f.read()
-                for line in content.split('\n'):
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        metadata[key.strip('"')] = value.strip('"')
+                metadata = parse_ss_metadata(f.read())
                         
             # Añadir información adicional
             metadata['format'] = 'MS/SS'
@@ -0,0 +1,166 @@
+"""
+Almacenamiento en disco de los registros procesados.
+Las series de cada registro se guardan en un archivo Arrow (formato IPC sin
+compresión) que se lee mediante memory-map: las columnas solo ocupan memoria
+cuando una pestaña las usa y el sistema operativo gestiona la paginación.
+"""
+
+import os
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+
+
+class LazyRecord(Mapping):
+    """
+    Registro de datos sísmicos con las series respaldadas por un archivo Arrow
+
+    Se comporta como el diccionario del registro: los campos pequeños
+    (nombre, componentes, metadatos, picos) se guardan en memoria y las
+    series se leen del archivo, sin copia y de solo lectura, al accederlas.
+    """
+
+    def __init__(self, path, fields, columns, aliases=None):
+        """
+        Args:
+            path (str): Ruta al archivo Arrow con las series
+            fields (dict): Campos del registro que no son series
+            columns (tuple): Nombres de las series guardadas en el archivo
+            aliases (dict, opcional): Claves que comparten la serie de otra clave
+        """
+        self._path = str(path)
+        self._fields = dict(fields)
+        self._columns = tuple(columns)
+        self._aliases = dict(aliases or {})
+        self._table = None
+
+    def _get_table(self):
+        if self._table is None:
+            source = pa.memory_map(self._path, 'r')
+            self._table = pa.ipc.open_file(source).read_all()
+        return self._table
+
+    def touch(self):
+        """
+        Comprueba que el archivo del registro sigue en disco y lo marca como usado
+
+        La fecha de modificación actualizada protege al archivo de prune_store
+        mientras el registro se siga consultando.
+
+        Returns:
+            bool: True si las series se pueden leer
+        """
+        try:
+            os.utime(self._path)
+        except FileNotFoundError:
+            return self._table is not None
+        except OSError:
+            pass
+        return True
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            return self._fields[key]
+        column = self._aliases.get(key, key)
+        if column in self._columns:
+            return self._get_table().column(column).to_numpy()
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from self._fields
+        yield from self._columns
+        yield from self._aliases
+
+    def __len__(self):
+        return len(self._fields) + len(self._columns) + len(self._aliases)
+
+    def __getstate__(self):
+        # El memory-map no se serializa: se vuelve a abrir al acceder a una serie
+        state = self.__dict__.copy()
+        state['_table'] = None
+        return state
+
+
+def prune_store(directory, max_files, pattern="*.arrow"):
+    """
+    Borra los archivos menos usados recientemente del almacén de registros
+
+    Args:
+        directory (str): Directorio del almacén
+        max_files (int): Número máximo de archivos que se conservan
+        pattern (str, opcional): Patrón de los archivos que cuentan para el límite
+    """
+    paths = []
+    for path in Path(directory).glob(pattern):
+        try:
+            paths.append((path.stat().st_mtime, path))
+        except FileNotFoundError:
+            pass
+    paths.sort(reverse=True)
+    for _, path in paths[max_files:]:
+        try:
+            path.unlink()
+        except OSError:
+            # Borrado por otro proceso, o abierto con memory-map (Windows)
+            pass
+
+
+def store_record(data, directory, key, max_files=None):
+    """
+    Guarda las series de un registro en disco y devuelve su versión diferida
+
+    Si las series no tienen todas la misma longitud el registro se devuelve
+    sin cambios, en memoria.
+
+    Args:
+        data (dict): Datos del registro procesados
+        directory (str): Directorio donde guardar el archivo
+        key (str): Identificador del contenido del registro (nombre del archivo)
+        max_files (int, opcional): Número máximo de archivos en el directorio;
+            se borran los menos usados recientemente (ver prune_store)
+
+    Returns:
+        Mapping: Registro con las series respaldadas en disco
+    """
+    columns = {}
+    aliases = {}
+    fields = {}
+    for name, value in data.items():
+        if not isinstance(value, np.ndarray):
+            fields[name] = value
+            continue
+        # Las claves que apuntan al mismo array se guardan una sola vez
+        shared = next((column for column, array in columns.items() if array is value), None)
+        if shared is not None:
+            aliases[name] = shared
+        else:
+            columns[name] = value
+
+    if len({len(array) for array in columns.values()}) > 1:
+        return data
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{key}.arrow"
+
+    # Escribir en un archivo temporal y reemplazar el definitivo de una vez:
+    # los registros que ya tienen abierto el archivo anterior siguen leyéndolo
+    table = pa.table(columns)
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False) as tmp:
+        tmp_path = tmp.name
+    with pa.OSFile(tmp_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        # El archivo está en uso (Windows); su contenido es el mismo para esta clave
+        os.unlink(tmp_path)
+
+    if max_files is not None:
+        prune_store(directory, max_files)
+
+    return LazyRecord(path, fields, tuple(columns), aliases)
@@ -2,9 +2,11 @@ import numpy as np
 import matplotlib.pyplot as plt
 from datetime import datetime
 import os
+import shutil
 from pathlib import Path
 from io import BytesIO
 import base64
+from fast_kernels import max_abs
 
 class ReportGenerator:
     def __init__(self):
@@ -15,7 +17,7 @@ class ReportGenerator:
         self.report_dir = Path("reportes")
         self.report_dir.mkdir(exist_ok=True)
     
-    def generate_report(self, data, analysis_results, output_format="pdf"):
+    def generate_report(self, data, analysis_results, output_format="pdf", options=None, output_path=None):
         """
         Genera un reporte automático con los resultados del análisis.
         
@@ -23,26 +25,130 @@ class ReportGenerator:
             data (dict): Datos del registro sísmico
             analysis_results (dict): Resultados del análisis
             output_format (str): Formato de salida ('pdf', 'html', 'docx')
+            options (dict, opcional): Secciones a incluir ('include_metadata',
+                'include_time_series', 'include_fft', 'include_response_spectrum',
+                'include_stats', 'include_events'). Las secciones no indicadas se
+                incluyen.
+            output_path (str, opcional): Ruta donde dejar el reporte generado
             
         Returns:
             str: Ruta al archivo de reporte generado
         """
+        options = options or {}
+        
+        # Entregar a los generadores solo las secciones seleccionadas
+        if not options.get('include_metadata', True):
+            data = {key: value for key, value in data.items() if key != 'metadata'}
+        excluded = set()
+        if not options.get('include_fft', True):
+            excluded.update(('fft_freq', 'fft_amp', 'fft_components'))
+        if not options.get('include_response_spectrum', True):
+            excluded.add('response_spectrum')
+        if not options.get('include_events', True):
+            excluded.add('events')
+        analysis_results = {
+            key: value for key, value in analysis_results.items() if key not in excluded
+        }
+        sections = {
+            'include_time_series': options.get('include_time_series', True),
+            'include_stats': options.get('include_stats', True)
+        }
+        
         # Nombre del archivo basado en la fecha y hora actual
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"reporte_{data['name'].replace(' ', '_')}_{timestamp}"
         
         if output_format == "pdf":
-            return self._generate_pdf_report(data, analysis_results, filename)
+            report_path = self._generate_pdf_report(data, analysis_results, filename, **sections)
         elif output_format == "html":
-            return self._generate_html_report(data, analysis_results, filename)
+            report_path = self._generate_html_report(data, analysis_results, filename, **sections)
         elif output_format == "docx":
-            return self._generate_docx_report(data, analysis_results, filename)
+            report_path = self._generate_docx_report(data, analysis_results, filename, **sections)
         else:
             raise ValueError(f"Formato de salida '{output_format}' no soportado")
+        
+        if output_path is not None:
+            report_path = shutil.move(report_path, str(output_path))
+        return str(report_path)
+    
+    def _acceleration_figure(self, data):
+        """
+        Crea el gráfico de aceleración de las componentes del registro
+        """
+        fig = plt.figure(figsize=(10, 6))
+        for component, label in zip(['N', 'E', 'Z'], ['Norte-Sur', 'Este-Oeste', 'Vertical']):
+            if f'{component}_aceleracion' in data:
+                plt.plot(data['time'], data[f'{component}_aceleracion'], label=f'{label}')
+        plt.title('Registro de Aceleración')
+        plt.xlabel('Tiempo (s)')
+        plt.ylabel('Aceleración (g)')
+        plt.grid(True)
+        plt.legend()
+        plt.tight_layout()
+        return fig
+    
+    def _fft_figure(self, analysis_results):
+        """
+        Crea el gráfico del espectro de Fourier de las componentes
+        
+        Usa 'fft_freq' (frecuencias) y 'fft_amp' (una fila de amplitudes por
+        componente, en el orden de 'fft_components') de los resultados.
+        """
+        frequencies = analysis_results['fft_freq']
+        amplitudes = np.atleast_2d(analysis_results['fft_amp'])
+        components = analysis_results.get('fft_components', range(1, len(amplitudes) + 1))
+        
+        # Se omite la componente continua (f = 0), que no cabe en el eje logarítmico
+        fig = plt.figure(figsize=(10, 6))
+        lines = plt.loglog(frequencies[1:], amplitudes[:, 1:].T)
+        for line, component in zip(lines, components):
+            line.set_label(f'Componente {component}')
+        plt.title('Espectro de Fourier')
+        plt.xlabel('Frecuencia (Hz)')
+        plt.ylabel('Amplitud')
+        plt.grid(True, which="both")
+        plt.legend()
+        plt.tight_layout()
+        return fig
     
-    def _generate_pdf_report(self, data, analysis_results, filename):
+    def _response_spectrum_figure(self, response_spectrum):
+        """
+        Crea el gráfico del espectro de respuesta
+        
+        Acepta un único espectro ({'periods', 'Sa', ...}) o un espectro por
+        componente ({componente: {'periods', 'Sa', ...}}).
+        """
+        if 'periods' in response_spectrum:
+            spectra = {'Pseudo-aceleración': response_spectrum}
+        else:
+            spectra = {f'Componente {component}': spectrum for component, spectrum in response_spectrum.items()}
+        
+        fig = plt.figure(figsize=(10, 6))
+        for label, spectrum in spectra.items():
+            plt.loglog(spectrum['periods'], spectrum['Sa'], label=label)
+        plt.title('Espectro de Respuesta')
+        plt.xlabel('Período (s)')
+        plt.ylabel('Sa (g)')
+        plt.grid(True, which="both")
+        plt.legend()
+        plt.tight_layout()
+        return fig
+    
+    def _format_triggers(self, triggers):
+        """
+        Describe los tiempos de inicio de los eventos detectados en una componente
+        """
+        if len(triggers) == 0:
+            return "Sin eventos detectados"
+        return ", ".join(f"{trigger:.2f} s" for trigger in triggers)
+    
+    def _generate_pdf_report(self, data, analysis_results, filename, include_time_series=True, include_stats=True):
         """
         Genera un reporte en formato PDF
+        
+        Args:
+            include_time_series (bool): Incluir el gráfico de aceleración
+            include_stats (bool): Incluir los parámetros del registro (PGA)
         """
         try:
             from fpdf import FPDF
@@ -74,17 +180,27 @@ class ReportGenerator:
                 pdf.cell(0, 8, f"{key}: {value}", 0, 1, "L")
         
         # Parámetros del registro
-        pdf.ln(5)
-        pdf.set_font("Arial", "B", 12)
-        pdf.cell(0, 8, "Parámetros del Registro:", 0, 1, "L")
-        pdf.set_font("Arial", "", 12)
-        
-        # Calcular parámetros
-        for component in ['N', 'E', 'Z']:
-            if f'{component}_aceleracion' in data:
-                acc_data = data[f'{component}_aceleracion']
-                pga = np.max(np.abs(acc_data))
-                pdf.cell(0, 8, f"PGA Componente {component}: {pga:.4f} g", 0, 1, "L")
+        if include_stats:
+            pdf.ln(5)
+            pdf.set_font("Arial", "B", 12)
+            pdf.cell(0, 8, "Parámetros del Registro:", 0, 1, "L")
+            pdf.set_font("Arial", "", 12)
+            
+            # Calcular parámetros
+            for component in ['N', 'E', 'Z']:
+                if f'{component}_aceleracion' in data:
+                    acc_data = data[f'{component}_aceleracion']
+                    pga = max_abs(acc_data)
+                    pdf.cell(0, 8, f"PGA Componente {component}: {pga:.4f} g", 0, 1, "L")
+        
+        # Eventos detectados
+        if 'events' in analysis_results:
+            pdf.ln(5)
+            pdf.set_font("Arial", "B", 12)
+            pdf.cell(0, 8, "Eventos Detectados (STA/LTA):", 0, 1, "L")
+            pdf.set_font("Arial", "", 12)
+            for component, triggers in analysis_results['events'].items():
+                pdf.cell(0, 8, f"Componente {component}: {self._format_triggers(triggers)}", 0, 1, "L")
         
         # Gráficos
         pdf.ln(10)
@@ -99,22 +215,22 @@ class ReportGenerator:
             return buf
         
         # Gráfico de aceleración
-        plt.figure(figsize=(10, 6))
-        for component, label in zip(['N', 'E', 'Z'], ['Norte-Sur', 'Este-Oeste', 'Vertical']):
-            if f'{component}_aceleracion' in data:
-                plt.plot(data['time'], data[f'{component}_aceleracion'], label=f'{label}')
-        plt.title('Registro de Aceleración')
-        plt.xlabel('Tiempo (s)')
-        plt.ylabel('Aceleración (g)')
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        
-        # Guardar gráfico en el PDF
-        img_buf = fig_to_img(plt.gcf())
-        plt.close()
+        if include_time_series:
+            img_buf = fig_to_img(self._acceleration_figure(data))
+            plt.close()
+            
+            pdf.image(img_buf, x=10, y=None, w=190)
         
-        pdf.image(img_buf, x=10, y=None, w=190)
+        # Si hay resultados de espectro de Fourier
+        if 'fft_amp' in analysis_results:
+            pdf.ln(5)
+            pdf.set_font("Arial", "B", 12)
+            pdf.cell(0, 8, "Espectro de Fourier:", 0, 1, "L")
+            
+            img_buf = fig_to_img(self._fft_figure(analysis_results))
+            plt.close()
+            
+            pdf.image(img_buf, x=10, y=None, w=190)
         
         # Si hay resultados de espectro de respuesta
         if 'response_spectrum' in analysis_results:
@@ -122,20 +238,8 @@ class ReportGenerator:
             pdf.set_font("Arial", "B", 12)
             pdf.cell(0, 8, "Espectro de Respuesta:", 0, 1, "L")
             
-            # Gráfico de espectro de respuesta
-            plt.figure(figsize=(10, 6))
-            plt.loglog(analysis_results['response_spectrum']['periods'], 
-                      analysis_results['response_spectrum']['Sa'], 
-                      label='Pseudo-aceleración')
-            plt.title('Espectro de Respuesta')
-            plt.xlabel('Período (s)')
-            plt.ylabel('Sa (g)')
-            plt.grid(True, which="both")
-            plt.legend()
-            plt.tight_layout()
-            
             # Guardar gráfico en el PDF
-            img_buf = fig_to_img(plt.gcf())
+            img_buf = fig_to_img(self._response_spectrum_figure(analysis_results['response_spectrum']))
             plt.close()
             
             pdf.image(img_buf, x=10, y=None, w=190)
@@ -145,9 +249,13 @@ class ReportGenerator:
         pdf.output(str(output_path))
         return str(output_path)
     
-    def _generate_html_report(self, data, analysis_results, filename):
+    def _generate_html_report(self, data, analysis_results, filename, include_time_series=True, include_stats=True):
         """
         Genera un reporte en formato HTML
+        
+        Args:
+            include_time_series (bool): Incluir el gráfico de aceleración
+            include_stats (bool): Incluir los parámetros del registro (PGA)
         """
         try:
             import jinja2
@@ -189,6 +297,7 @@ class ReportGenerator:
                     </table>
                     {% endif %}
                     
+                    {% if include_stats %}
                     <h3>Parámetros del Registro</h3>
                     <table>
                         <tr><th>Componente</th><th>PGA (g)</th></tr>
@@ -201,14 +310,34 @@ class ReportGenerator:
                         {% endif %}
                         {% endfor %}
                     </table>
+                    {% endif %}
+                    
+                    {% if 'events' in analysis_results %}
+                    <h3>Eventos Detectados (STA/LTA)</h3>
+                    <table>
+                        <tr><th>Componente</th><th>Inicio de eventos</th></tr>
+                        {% for comp, triggers in analysis_results['events'].items() %}
+                        <tr><td>{{ comp }}</td><td>{{ format_triggers(triggers) }}</td></tr>
+                        {% endfor %}
+                    </table>
+                    {% endif %}
                 </div>
                 
                 <div class="graph-section">
                     <h2>Gráficos de Análisis</h2>
+                    {% if acceleration_plot %}
                     <div>
                         <h3>Registro de Aceleración</h3>
                         <img src="data:image/png;base64,{{ acceleration_plot }}" style="width:100%;">
                     </div>
+                    {% endif %}
+                    
+                    {% if fft_plot %}
+                    <div>
+                        <h3>Espectro de Fourier</h3>
+                        <img src="data:image/png;base64,{{ fft_plot }}" style="width:100%;">
+                    </div>
+                    {% endif %}
                     
                     {% if 'response_spectrum' in analysis_results %}
                     <div>
@@ -231,40 +360,26 @@ class ReportGenerator:
             return img_str
         
         # Generar gráficos
-        # Gráfico de aceleración
-        plt.figure(figsize=(10, 6))
-        for component, label in zip(['N', 'E', 'Z'], ['Norte-Sur', 'Este-Oeste', 'Vertical']):
-            if f'{component}_aceleracion' in data:
-                plt.plot(data['time'], data[f'{component}_aceleracion'], label=f'{label}')
-        plt.title('Registro de Aceleración')
-        plt.xlabel('Tiempo (s)')
-        plt.ylabel('Aceleración (g)')
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        acceleration_plot = fig_to_base64(plt.gcf())
-        plt.close()
+        # Gráfico de aceleración (si se solicita)
+        acceleration_plot = ""
+        if include_time_series:
+            acceleration_plot = fig_to_base64(self._acceleration_figure(data))
+            plt.close()
+        
+        # Gráfico de espectro de Fourier (si existe)
+        fft_plot = ""
+        if 'fft_amp' in analysis_results:
+            fft_plot = fig_to_base64(self._fft_figure(analysis_results))
+            plt.close()
         
         # Gráfico de espectro de respuesta (si existe)
         response_spectrum_plot = ""
         if 'response_spectrum' in analysis_results:
-            plt.figure(figsize=(10, 6))
-            plt.loglog(analysis_results['response_spectrum']['periods'], 
-                      analysis_results['response_spectrum']['Sa'], 
-                      label='Pseudo-aceleración')
-            plt.title('Espectro de Respuesta')
-            plt.xlabel('Período (s)')
-            plt.ylabel('Sa (g)')
-            plt.grid(True, which="both")
-            plt.legend()
-            plt.tight_layout()
-            response_spectrum_plot = fig_to_base64(plt.gcf())
+            response_spectrum_plot = fig_to_base64(
+                self._response_spectrum_figure(analysis_results['response_spectrum'])
+            )
             plt.close()
         
-        # Función auxiliar para obtener el valor máximo absoluto
-        def max_abs(arr):
-            return np.max(np.abs(arr))
-        
         # Renderizar plantilla
         template = jinja2.Template(html_template)
         html_content = template.render(
@@ -273,8 +388,11 @@ class ReportGenerator:
             metadata=data.get('metadata', {}),
             data=data,
             max_abs=max_abs,
+            format_triggers=self._format_triggers,
+            include_stats=include_stats,
             analysis_results=analysis_results,
             acceleration_plot=acceleration_plot,
+            fft_plot=fft_plot,
             response_spectrum_plot=response_spectrum_plot
         )
         
@@ -288,9 +406,13 @@ class ReportGenerator:
         
         return str(output_path)
     
-    def _generate_docx_report(self, data, analysis_results, filename):
+    def _generate_docx_report(self, data, analysis_results, filename, include_time_series=True, include_stats=True):
         """
         Genera un reporte en formato DOCX
+        
+        Args:
+            include_time_series (bool): Incluir el gráfico de aceleración
+            include_stats (bool): Incluir los parámetros del registro (PGA)
         """
         try:
             from docx import Document
@@ -327,63 +449,78 @@ class ReportGenerator:
                 row_cells[1].text = str(value)
         
         # Parámetros del registro
-        doc.add_heading('Parámetros del Registro', level=2)
-        
-        table = doc.add_table(rows=1, cols=2)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'Componente'
-        hdr_cells[1].text = 'PGA (g)'
+        if include_stats:
+            doc.add_heading('Parámetros del Registro', level=2)
+            
+            table = doc.add_table(rows=1, cols=2)
+            table.style = 'Table Grid'
+            hdr_cells = table.rows[0].cells
+            hdr_cells[0].text = 'Componente'
+            hdr_cells[1].text = 'PGA (g)'
+            
+            for component, label in zip(['N', 'E', 'Z'], ['Norte-Sur', 'Este-Oeste', 'Vertical']):
+                if f'{component}_aceleracion' in data:
+                    acc_data = data[f'{component}_aceleracion']
+                    pga = max_abs(acc_data)
+                    
+                    row_cells = table.add_row().cells
+                    row_cells[0].text = label
+                    row_cells[1].text = f"{pga:.4f}"
         
-        for component, label in zip(['N', 'E', 'Z'], ['Norte-Sur', 'Este-Oeste', 'Vertical']):
-            if f'{component}_aceleracion' in data:
-                acc_data = data[f'{component}_aceleracion']
-                pga = np.max(np.abs(acc_data))
-                
+        # Eventos detectados
+        if 'events' in analysis_results:
+            doc.add_heading('Eventos Detectados (STA/LTA)', level=2)
+            
+            table = doc.add_table(rows=1, cols=2)
+            table.style = 'Table Grid'
+            hdr_cells = table.rows[0].cells
+            hdr_cells[0].text = 'Componente'
+            hdr_cells[1].text = 'Inicio de eventos'
+            
+            for component, triggers in analysis_results['events'].items():
                 row_cells = table.add_row().cells
-                row_cells[0].text = label
-                row_cells[1].text = f"{pga:.4f}"
+                row_cells[0].text = component
+                row_cells[1].text = self._format_triggers(triggers)
         
         # Gráficos
         doc.add_heading('Gráficos de Análisis', level=1)
         
         # Gráfico de aceleración
-        plt.figure(figsize=(10, 6))
-        for component, label in zip(['N', 'E', 'Z'], ['Norte-Sur', 'Este-Oeste', 'Vertical']):
-            if f'{component}_aceleracion' in data:
-                plt.plot(data['time'], data[f'{component}_aceleracion'], label=f'{label}')
-        plt.title('Registro de Aceleración')
-        plt.xlabel('Tiempo (s)')
-        plt.ylabel('Aceleración (g)')
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        
-        # Guardar temporalmente y agregar al documento
-        temp_img = BytesIO()
-        plt.savefig(temp_img, format='png', dpi=200, bbox_inches='tight')
-        temp_img.seek(0)
-        plt.close()
+        if include_time_series:
+            self._acceleration_figure(data)
+            
+            # Guardar temporalmente y agregar al documento
+            temp_img = BytesIO()
+            plt.savefig(temp_img, format='png', dpi=200, bbox_inches='tight')
+            temp_img.seek(0)
+            plt.close()
+            
+            doc.add_picture(temp_img, width=Inches(6.0))
+            last_paragraph = doc.paragraphs[-1]
+            last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
         
-        doc.add_picture(temp_img, width=Inches(6.0))
-        last_paragraph = doc.paragraphs[-1]
-        last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        # Si hay resultados de espectro de Fourier
+        if 'fft_amp' in analysis_results:
+            doc.add_heading('Espectro de Fourier', level=2)
+            
+            self._fft_figure(analysis_results)
+            
+            # Guardar temporalmente y agregar al documento
+            temp_img = BytesIO()
+            plt.savefig(temp_img, format='png', dpi=200, bbox_inches='tight')
+            temp_img.seek(0)
+            plt.close()
+            
+            doc.add_picture(temp_img, width=Inches(6.0))
+            last_paragraph = doc.paragraphs[-1]
+            last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
         
         # Si hay resultados de espectro de respuesta
         if 'response_spectrum' in analysis_results:
             doc.add_heading('Espectro de Respuesta', level=2)
             
             # Gráfico de espectro de respuesta
-            plt.figure(figsize=(10, 6))
-            plt.loglog(analysis_results['response_spectrum']['periods'], 
-                      analysis_results['response_spectrum']['Sa'], 
-                      label='Pseudo-aceleración')
-            plt.title('Espectro de Respuesta')
-            plt.xlabel('Período (s)')
-            plt.ylabel('Sa (g)')
-            plt.grid(True, which="both")
-            plt.legend()
-            plt.tight_layout()
+            self._response_spectrum_figure(analysis_results['response_spectrum'])
             
             # Guardar temporalmente y agregar al documento
             temp_img = BytesIO()
@@ -1,6 +1,7 @@
 import numpy as np
 from scipy import signal
 from filters import SignalFilter
+from fast_kernels import cumulative_trapezoid, max_abs
 
 class SignalProcessor:
     def __init__(self, sampling_rate):
@@ -55,11 +56,8 @@ class SignalProcessor:
         
         # Integración trapezoidal
         dt = time[1] - time[0]  # Intervalo de tiempo
-        velocity = np.zeros_like(acc_filtered)
-        
         # Método trapezoidal: v(n) = v(n-1) + (a(n) + a(n-1))*dt/2
-        for i in range(1, len(velocity)):
-            velocity[i] = velocity[i-1] + (acc_filtered[i] + acc_filtered[i-1]) * dt / 2
+        velocity = cumulative_trapezoid(acc_filtered, dt)
         
         # Corrección de línea base para la velocidad
         velocity = self.remove_baseline(velocity)
@@ -88,11 +86,8 @@ class SignalProcessor:
         
         # Integración trapezoidal
         dt = time[1] - time[0]  # Intervalo de tiempo
-        displacement = np.zeros_like(vel_filtered)
-        
         # Método trapezoidal: d(n) = d(n-1) + (v(n) + v(n-1))*dt/2
-        for i in range(1, len(displacement)):
-            displacement[i] = displacement[i-1] + (vel_filtered[i] + vel_filtered[i-1]) * dt / 2
+        displacement = cumulative_trapezoid(vel_filtered, dt)
         
         # Corrección de línea base para el desplazamiento
         displacement = self.remove_baseline(displacement)
@@ -114,6 +109,11 @@ class SignalProcessor:
         # Integrar velocidad para obtener desplazamiento
         displacement = self.integrate_velocity(velocity, time)
         
+        # Conservar la precisión de la entrada (float32 si la aceleración lo es)
+        dtype = np.result_type(acceleration.dtype, np.float32)
+        velocity = velocity.astype(dtype, copy=False)
+        displacement = displacement.astype(dtype, copy=False)
+        
         return {
             'acceleration': acceleration,
             'velocity': velocity,
@@ -138,43 +138,51 @@ class SignalProcessor:
             periods = np.logspace(-2, 1, 100)  # 0.01s a 10s
             
         dt = time[1] - time[0]
-        omega = 2 * np.pi / periods
         Sa = np.zeros_like(periods)
         Sv = np.zeros_like(periods)
         Sd = np.zeros_like(periods)
         
-        for i, T in enumerate(periods):
-            # Parámetros del sistema de 1GDL
-            w = 2 * np.pi / T
-            c = 2 * damping_ratio * w
-            k = w * w
-            
-            # Resolver ecuación diferencial usando método de Newmark-Beta
-            u = np.zeros_like(acceleration)  # Desplazamiento
-            v = np.zeros_like(acceleration)  # Velocidad
-            
-            # Parámetros de Newmark-Beta (promedio constante de aceleración)
-            gamma = 0.5
-            beta = 0.25
-            
-            # Constantes para el método
-            a1 = 1 / (beta * dt * dt) + (gamma * c) / (beta * dt)
-            a2 = 1 / (beta * dt)
-            a3 = 1 / (2 * beta) - 1
-            
-            for j in range(1, len(acceleration)):
-                # Predictor
-                dp = -k * u[j-1] - c * v[j-1] - acceleration[j]
-                
-                # Corrector
-                du = dp / (k + a1)
-                u[j] = u[j-1] + du
-                v[j] = v[j-1] + a2 * du
+        # Parámetros de Newmark-Beta (promedio constante de aceleración)
+        gamma = 0.5
+        beta = 0.25
+        
+        # Parámetros de los sistemas de 1GDL y constantes del método,
+        # calculados para todos los periodos a la vez
+        omega = 2 * np.pi / np.asarray(periods, dtype=np.float64)
+        damping = 2 * damping_ratio * omega
+        stiffness = omega * omega
+        a1 = 1 / (beta * dt * dt) + (gamma * damping) / (beta * dt)
+        a2 = 1 / (beta * dt)
+        
+        # El paso de Newmark es lineal en el estado x = (u, v):
+        #   du = -(k*u[j-1] + c*v[j-1] + a[j]) / (k + a1)
+        #   u[j] = u[j-1] + du,  v[j] = v[j-1] + a2*du
+        # es decir x[j] = A x[j-1] + B a[j], que equivale a un filtro IIR de
+        # segundo orden por periodo (mismo denominador para u y v)
+        g = 1 / (stiffness + a1)
+        A11 = 1 - g * stiffness
+        A12 = -g * damping
+        A21 = -a2 * g * stiffness
+        A22 = 1 - a2 * g * damping
+        B1 = -g
+        B2 = -a2 * g
+        den = np.column_stack([np.ones_like(g), -(A11 + A22), A11 * A22 - A12 * A21])
+        num_u = np.column_stack([B1, A12 * B2 - A22 * B1])
+        num_v = np.column_stack([B2, A21 * B1 - A11 * B2])
+        
+        # La recurrencia parte del reposo (u[0] = v[0] = 0) y usa a[j] desde j = 1
+        excitation = np.array(acceleration, dtype=np.float64)
+        excitation[0] = 0.0
+        
+        for i in range(len(periods)):
+            # Resolver la respuesta del oscilador con el filtro equivalente (en C)
+            u = signal.lfilter(num_u[i], den[i], excitation)  # Desplazamiento
+            v = signal.lfilter(num_v[i], den[i], excitation)  # Velocidad
             
             # Calcular valores máximos
-            Sd[i] = np.max(np.abs(u))
-            Sv[i] = np.max(np.abs(v))
-            Sa[i] = w * w * Sd[i]  # Relación entre Sa y Sd
+            Sd[i] = max_abs(u)
+            Sv[i] = max_abs(v)
+            Sa[i] = stiffness[i] * Sd[i]  # Relación entre Sa y Sd (w² * Sd)
         
         return {
             'periods': periods,
@@ -1,13 +1,23 @@
 import unittest
+from unittest import mock
 import numpy as np
+import pandas as pd
 from ms_reader import MSReader
 from fft_processor import FFTProcessor
 from filters import SignalFilter
+from signal_processor import SignalProcessor
 from event_detector import EventDetector
 from data_exporter import DataExporter
+from fast_kernels import (NUMBA_AVAILABLE, abs_argmax, cumulative_trapezoid, lttb_indices,
+                          magnitude_and_peaks, max_abs, peaks_above, summary_stats)
+from downsampling import lttb
+from record_store import store_record
+from format_readers import parse_ss_metadata
+import pickle
 import os
 import tempfile
 import shutil
+from pathlib import Path
 
 class TestMSReader(unittest.TestCase):
     def setUp(self):
@@ -84,6 +94,36 @@ class TestSignalFilter(unittest.TestCase):
         freq_20hz_idx = np.abs(freqs - 20).argmin()
         self.assertLess(np.abs(fft_filt[freq_20hz_idx]), np.abs(fft_orig[freq_20hz_idx]))
 
+class TestSignalProcessor(unittest.TestCase):
+    def setUp(self):
+        self.sampling_rate = 100
+        self.time = np.arange(1000) / self.sampling_rate
+        self.acceleration = np.sin(2 * np.pi * 2 * self.time) * np.exp(-0.3 * self.time)
+        self.processor = SignalProcessor(self.sampling_rate)
+        
+    def test_response_spectrum(self):
+        periods = np.array([0.1, 0.5, 2.0])
+        spectrum = self.processor.compute_response_spectrum(
+            self.acceleration, self.time, periods=periods
+        )
+        
+        # Referencia: paso de Newmark muestra a muestra
+        dt = self.time[1] - self.time[0]
+        for i, T in enumerate(periods):
+            w = 2 * np.pi / T
+            c = 2 * 0.05 * w
+            k = w * w
+            a1 = 4 / (dt * dt) + 2 * c / dt
+            u = np.zeros_like(self.acceleration)
+            v = np.zeros_like(self.acceleration)
+            for j in range(1, len(self.acceleration)):
+                du = (-k * u[j-1] - c * v[j-1] - self.acceleration[j]) / (k + a1)
+                u[j] = u[j-1] + du
+                v[j] = v[j-1] + 4 / dt * du
+            self.assertAlmostEqual(spectrum['Sd'][i], np.max(np.abs(u)), places=10)
+            self.assertAlmostEqual(spectrum['Sv'][i], np.max(np.abs(v)), places=10)
+            self.assertAlmostEqual(spectrum['Sa'][i], k * np.max(np.abs(u)), places=8)
+
 class TestEventDetector(unittest.TestCase):
     def setUp(self):
         self.sampling_rate = 100
@@ -111,6 +151,16 @@ class TestEventDetector(unittest.TestCase):
         
         # Debe detectar aproximadamente 3 eventos
         self.assertTrue(2 <= len(events) <= 4)
+        
+    def test_event_features_batch(self):
+        event_times = [0.5, 10.0, 30.0, 59.9]
+        batch = self.detector.calculate_event_features_batch(self.test_signal, event_times)
+        
+        # Debe coincidir con el cálculo evento por evento
+        for i, event_time in enumerate(event_times):
+            features = self.detector.calculate_event_features(self.test_signal, event_time)
+            for key, value in features.items():
+                self.assertAlmostEqual(batch[key][i], value)
 
 class TestDataExporter(unittest.TestCase):
     def setUp(self):
@@ -135,9 +185,178 @@ class TestDataExporter(unittest.TestCase):
         csv_path = self.exporter.export_raw_data(self.test_data, 'test', 'csv')
         self.assertTrue(os.path.exists(csv_path))
         
+        # El CSV debe coincidir con el que escribe pandas, incluidos NaN y
+        # float32, también cuando se escribe en varios bloques de filas
+        data = dict(self.test_data)
+        data['E'] = data['E'].astype(np.float32)
+        data['N'] = data['N'].copy()
+        data['N'][[0, 5]] = [np.nan, -0.0]
+        with mock.patch('data_exporter.CSV_BLOCK_ROWS', 300):
+            csv_path = self.exporter.export_raw_data(data, 'test_pandas', 'csv')
+        expected = pd.DataFrame({k: data[k] for k in ['time', 'E', 'N', 'Z']}).to_csv(index=False)
+        with open(csv_path, newline='') as f:
+            self.assertEqual(f.read(), expected.replace('\n', os.linesep))
+        
         # Probar exportación Excel
         xlsx_path = self.exporter.export_raw_data(self.test_data, 'test', 'excel')
         self.assertTrue(os.path.exists(xlsx_path))
+        
+        # Probar exportación Parquet y Feather (columnas binarias sin pérdida)
+        parquet_path = self.exporter.export_raw_data(self.test_data, 'test', 'parquet')
+        feather_path = self.exporter.export_raw_data(self.test_data, 'test', 'feather')
+        for path in (parquet_path, feather_path):
+            df = pd.read_parquet(path) if path.suffix == '.parquet' else pd.read_feather(path)
+            self.assertEqual(list(df.columns), ['time', 'E', 'N', 'Z'])
+            np.testing.assert_array_equal(df['N'].to_numpy(), self.test_data['N'])
+
+class TestFastKernels(unittest.TestCase):
+    def setUp(self):
+        self.test_signal = np.random.randn(5000)
+        
+    def test_abs_argmax(self):
+        idx, value = abs_argmax(self.test_signal)
+        
+        # Debe coincidir con la búsqueda directa sobre el valor absoluto
+        expected_idx = np.argmax(np.abs(self.test_signal))
+        self.assertEqual(idx, expected_idx)
+        self.assertEqual(value, self.test_signal[expected_idx])
+        
+        # Ante un empate de |valor| se elige la primera muestra, como np.argmax
+        self.assertEqual(abs_argmax(np.array([1.0, -3.0, 3.0])), (1, -3.0))
+        self.assertEqual(abs_argmax(np.array([1.0, 3.0, -3.0])), (1, 3.0))
+        
+    def test_max_abs(self):
+        self.assertEqual(max_abs(self.test_signal), np.max(np.abs(self.test_signal)))
+        self.assertEqual(max_abs(np.array([1.0, -3.0, 2.0])), 3.0)
+        
+    @unittest.skipUnless(NUMBA_AVAILABLE, "Numba no instalado")
+    def test_peaks_above(self):
+        from scipy.signal import find_peaks
+        # Señal cuantizada para incluir mesetas y empates de altura
+        abs_data = np.abs(np.round(self.test_signal * 10))
+        threshold = 2 * np.std(abs_data)
+        for distance in (1, 50):
+            peaks, heights = peaks_above(abs_data, threshold, distance)
+            expected, properties = find_peaks(abs_data, height=threshold, distance=distance)
+            np.testing.assert_array_equal(peaks, expected)
+            np.testing.assert_array_equal(heights, properties['peak_heights'])
+        
+    def test_magnitude_and_peaks(self):
+        components = [self.test_signal, self.test_signal[::-1], 2 * self.test_signal]
+        magnitude, peaks = magnitude_and_peaks(components)
+        
+        # Debe coincidir con la raíz de la suma de cuadrados y con abs_argmax
+        expected = np.sqrt(sum(values ** 2 for values in components))
+        np.testing.assert_allclose(magnitude, expected, rtol=1e-12)
+        self.assertEqual(len(peaks), 4)
+        for values, peak in zip(components + [magnitude], peaks):
+            self.assertEqual(peak, abs_argmax(values))
+        
+    def test_cumulative_trapezoid(self):
+        dt = 0.01
+        result = cumulative_trapezoid(self.test_signal, dt)
+        
+        # Debe coincidir con la regla trapezoidal acumulada de SciPy
+        from scipy.integrate import cumulative_trapezoid as scipy_cumtrapz
+        expected = scipy_cumtrapz(self.test_signal, dx=dt, initial=0)
+        self.assertEqual(len(result), len(self.test_signal))
+        np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-12)
+        
+    def test_summary_stats(self):
+        stats = summary_stats(self.test_signal)
+        
+        # Debe coincidir con las reducciones de NumPy por separado
+        self.assertAlmostEqual(stats['min'], np.min(self.test_signal))
+        self.assertAlmostEqual(stats['max'], np.max(self.test_signal))
+        self.assertAlmostEqual(stats['mean'], np.mean(self.test_signal))
+        self.assertAlmostEqual(stats['std'], np.std(self.test_signal))
+        self.assertAlmostEqual(stats['rms'], np.sqrt(np.mean(np.square(self.test_signal))))
+
+class TestDownsampling(unittest.TestCase):
+    def setUp(self):
+        self.time = np.arange(30000) / 100.0
+        self.test_signal = np.random.normal(0, 0.1, len(self.time))
+        self.test_signal[12345] = 5.0  # Pico aislado
+        
+    def test_lttb(self):
+        x_ds, y_ds = lttb(self.time, self.test_signal, 2000)
+        
+        self.assertEqual(len(x_ds), 2000)
+        # Se conservan los extremos y el pico de la señal
+        self.assertEqual(x_ds[0], self.time[0])
+        self.assertEqual(x_ds[-1], self.time[-1])
+        self.assertEqual(y_ds.max(), 5.0)
+        self.assertTrue(np.all(np.diff(x_ds) > 0))
+        
+    @unittest.skipUnless(NUMBA_AVAILABLE, "Numba no instalado")
+    def test_lttb_indices(self):
+        # El núcleo compilado elige las mismas muestras que la versión NumPy
+        edges = np.linspace(1, len(self.time) - 1, 1999).astype(np.int64)
+        indices = lttb_indices(self.time, self.test_signal, edges)
+        
+        self.assertEqual(len(indices), 2000)
+        self.assertEqual(self.test_signal[indices].max(), 5.0)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        
+        with mock.patch.multiple('downsampling', NUMBA_AVAILABLE=False, TSDOWNSAMPLE_AVAILABLE=False):
+            x_ds, y_ds = lttb(self.time, self.test_signal, 2000)
+        np.testing.assert_array_equal(x_ds, self.time[indices])
+        np.testing.assert_array_equal(y_ds, self.test_signal[indices])
+
+class TestRecordStore(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        acceleration = np.random.randn(1000).astype(np.float32)
+        self.data = {
+            'time': np.arange(1000) / 100.0,
+            'N': acceleration,
+            'N_aceleracion': acceleration,
+            'components': ['N'],
+            'name': 'test.ms'
+        }
+        
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+        
+    def test_store_record(self):
+        record = store_record(self.data, self.test_dir, 'test')
+        
+        # Las series se leen del archivo con los mismos valores y tipo
+        np.testing.assert_array_equal(record['time'], self.data['time'])
+        np.testing.assert_array_equal(record['N_aceleracion'], self.data['N'])
+        self.assertEqual(record['N'].dtype, np.float32)
+        self.assertEqual(record['components'], ['N'])
+        self.assertEqual(set(record), set(self.data))
+        
+        # El registro se puede serializar (caché de Streamlit)
+        restored = pickle.loads(pickle.dumps(record))
+        np.testing.assert_array_equal(restored['N'], self.data['N'])
+        
+    def test_prune_store(self):
+        records = [store_record(self.data, self.test_dir, f'test{i}') for i in range(3)]
+        for i, record in enumerate(records):
+            os.utime(record._path, (i, i))
+        # Consultar un registro lo marca como usado recientemente
+        self.assertTrue(records[0].touch())
+        
+        record = store_record(self.data, self.test_dir, 'test3', max_files=2)
+        remaining = sorted(path.name for path in Path(self.test_dir).glob('*.arrow'))
+        self.assertEqual(remaining, ['test0.arrow', 'test3.arrow'])
+        self.assertTrue(record.touch())
+        
+        # Un registro cuyo archivo se ha borrado lo indica para reconstruirlo
+        self.assertFalse(pickle.loads(pickle.dumps(records[1])).touch())
+
+class TestFormatReaders(unittest.TestCase):
+    def test_parse_ss_metadata(self):
+        content = '"sampling_rate"=200\n"sensor_name"="EpiSensor"\n"note"="a=b"\nsin separador\n'
+        metadata = parse_ss_metadata(content)
+        
+        self.assertEqual(metadata, {
+            'sampling_rate': '200',
+            'sensor_name': 'EpiSensor',
+            'note': 'a=b'
+        })
 
 if __name__ == '__main__':
     unittest.main()